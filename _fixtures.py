@@ -0,0 +1,56 @@
+"""
+Shared input templates and calculator instances for the test scripts
+
+Frozen PostMountedInputs; build a case with
+dataclasses.replace(POST_BASE, post_section_type=SectionType.SQUARE).
+"""
+
+from dataclasses import replace
+from functools import lru_cache
+from wind_calculator import WindLoadCalculator, TerrainType
+from post_mounted_calculator import PostMountedInputs, PostMaterial
+
+# 3.0m × 2.0m sign on a 4.5m CHS 150×8 post, country terrain
+POST_BASE = PostMountedInputs(
+    sign_width=3.0,  # m
+    sign_height=2.0,  # m
+    sign_depth=0.3,  # m
+    sign_base_height=2.5,  # m
+    post_height=4.5,  # m
+    site_altitude=50,  # m
+    v_map=22.5,  # m/s
+    distance_to_shore=20,  # km
+    terrain_type=TerrainType.COUNTRY,
+    post_diameter=150,  # mm
+    post_thickness=8,  # mm
+    post_steel_grade=275,  # N/mm²
+    foundation_type='concrete',
+    embedment_depth=1.5  # m
+)
+
+# Same sign on a solid C24 timber post (section size set per case)
+TIMBER_BASE = replace(
+    POST_BASE,
+    post_diameter=None,
+    post_thickness=None,
+    post_material=PostMaterial.TIMBER,
+    post_steel_grade=24,  # C24 bending strength
+)
+
+
+@lru_cache(maxsize=1)
+def _wind_calculator() -> WindLoadCalculator:
+    return WindLoadCalculator()
+
+
+def get_wind_calculator() -> WindLoadCalculator:
+    """
+    The process-wide WindLoadCalculator, with its warnings reset
+    
+    The helper methods append to calc.warnings outside
+    calculate_wind_loading, so each caller starts from a fresh list
+    (rebound, not cleared, so earlier results keep theirs).
+    """
+    calc = _wind_calculator()
+    calc.warnings = []
+    return calc
@@ -205,7 +205,7 @@ def calculate_wind_loading():
                     'zone': results['zone'],
                     'A_ref': round(results['A_ref'], 2)
                 },
-                'assessment': results.get('assessment', {}),
+                'assessment': results['assessment'].to_dict(),
                 'reference': results['reference']
             })
         
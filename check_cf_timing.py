@@ -0,0 +1,23 @@
+"""
+Time scalar vs vectorised wall-mounted c_f evaluation
+Run directly: python check_cf_timing.py
+"""
+
+import time
+import numpy as np
+from wind_calculator import WindLoadCalculator
+
+calculator = WindLoadCalculator()
+h_d = np.linspace(0.25, 5.0, 10000)
+
+start = time.perf_counter_ns()
+for x in h_d.tolist():
+    calculator.calculate_force_coefficient(x, 1.0)
+scalar_ns = time.perf_counter_ns() - start
+
+start = time.perf_counter_ns()
+calculator.calculate_force_coefficient_array(h_d, 1.0)
+vectorised_ns = time.perf_counter_ns() - start
+
+print(f'Scalar path:     {scalar_ns / 1e6:.2f} ms')
+print(f'Vectorised path: {vectorised_ns / 1e6:.2f} ms ({scalar_ns / vectorised_ns:.0f}x)')
@@ -0,0 +1,43 @@
+"""
+Shared pytest configuration
+
+Runs one canonical calculation through each calculator at session start,
+so module imports, the memoized post pressure helpers and NumPy's first-call
+setup are paid once in fixture setup rather than inside whichever test
+happens to run first.
+"""
+
+import pytest
+from projecting_sign_calculator import ProjectingSignCalculator
+from post_mounted_calculator import PostMountedCalculator
+from sign_construction import SignConstructionCalculator
+from _fixtures import POST_BASE, get_wind_calculator
+
+# Smallest complete input sets for each calculator
+_WALL_INPUTS = {
+    'sign_width': 3.0,
+    'sign_height': 1.0,
+    'sign_depth': 0.1,
+    'building_height': 6.0,
+    'site_altitude': 50,
+    'v_map': 22.5,
+}
+
+_PROJECTING_INPUTS = {
+    'sign_width': 1.0, 'sign_height': 1.0, 'projection': 0.6,
+    'mounting_height': 4.0, 'terrain_category': 'III', 'v_b_0': 22.5,
+    'sign_weight': 0.1, 'n_brackets': 2, 'bracket_spacing': 0.8,
+    'n_fixings_per_bracket': 4, 'fixing_pitch_vertical': 0.15,
+    'anchor_tension_capacity': 12.0, 'anchor_shear_capacity': 8.0,
+    'anchor_gamma_M': 1.5, 'bracket_width': 80, 'bracket_depth': 60,
+    'bracket_thickness': 5, 'bracket_steel_grade': 275,
+}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _warm_calculators():
+    """Exercise every calculator once before the first test"""
+    get_wind_calculator().calculate_wind_loading(_WALL_INPUTS)
+    ProjectingSignCalculator().calculate_wind_loading(_PROJECTING_INPUTS)
+    PostMountedCalculator().calculate_wind_loading(POST_BASE)
+    SignConstructionCalculator().calculate_panel_adequacy_batch([300, 400], 828)
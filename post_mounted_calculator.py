@@ -10,9 +10,289 @@ Standard: BS EN 1991-1-4:2005+A1:2010 + SCI P394
 Version: 1.0.0
 """
 
+import math
+from functools import lru_cache
 import numpy as np
-from typing import Dict, List, Tuple, Any
-from wind_calculator import WindLoadCalculator
+from dataclasses import dataclass, fields, MISSING
+from enum import IntEnum
+from typing import Dict, List, Tuple, Any, Optional, Union
+from wind_calculator import (
+    WindLoadCalculator, WindInputs, TerrainType, WindWarning,
+    _altitude_factor, _exposure_factor, _parse_distance, _peak_velocity_pressure,
+    _town_correction, _vmap_lookup,
+)
+
+
+class SectionType(IntEnum):
+    """Post cross-section shape; SectionType('square') also accepted"""
+    CIRCULAR = 0
+    SQUARE = 1
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+class PostMaterial(IntEnum):
+    """Post material; PostMaterial('timber') also accepted"""
+    STEEL = 0
+    ALUMINIUM = 1
+    TIMBER = 2
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+# Force coefficient of the post itself, indexed by SectionType
+# (circular cylinder P394 Table 5.4; sharp-edged square, conservative)
+_C_F_POST = (0.7, 2.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PostMountedInputs:
+    """
+    Inputs for PostMountedCalculator.calculate_wind_loading
+    
+    Field names match the keys of the legacy input dictionary; see
+    calculate_wind_loading for units. Optional post/foundation fields left
+    as None skip the corresponding check, as an absent key did before.
+    Categorical fields accept the enum or its lower-case name and are
+    stored as the enum.
+    """
+    sign_width: float
+    sign_height: float
+    sign_depth: float
+    sign_base_height: float
+    site_altitude: float
+    v_map: float
+    distance_to_shore: Union[float, str]
+    terrain_type: TerrainType
+    post_height: Optional[float] = None
+    distance_into_town: float = 0
+    post_diameter: Optional[float] = None
+    post_thickness: Optional[float] = None
+    post_section_type: SectionType = SectionType.CIRCULAR
+    post_material: PostMaterial = PostMaterial.STEEL
+    post_steel_grade: float = 275
+    foundation_type: str = 'concrete'
+    embedment_depth: Optional[float] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'terrain_type', TerrainType(self.terrain_type))
+        object.__setattr__(self, 'post_section_type', SectionType(self.post_section_type))
+        object.__setattr__(self, 'post_material', PostMaterial(self.post_material))
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'PostMountedInputs':
+        """Build from an input dictionary (raises KeyError for missing required keys)"""
+        kwargs = {}
+        for f in fields(cls):
+            if f.name in d:
+                kwargs[f.name] = d[f.name]
+            elif f.default is MISSING:
+                raise KeyError(f.name)
+        return cls(**kwargs)
+
+
+# Shear yield factor, evaluated once at import rather than per check
+_SQRT3 = math.sqrt(3)
+
+
+@lru_cache(maxsize=256)
+def _exposure_coeffs(height: float, displacement: float,
+                     distance_to_shore: float, terrain_type: TerrainType) -> Tuple[float, str]:
+    """
+    Memoized WindLoadCalculator.calculate_exposure_factor
+    
+    The terrain zone branches and log-height terms depend only on these
+    four values, which repeat across every run for the same site.
+    
+    Returns:
+        (c_e, zone) where zone is 'A', 'B', or 'C'
+    """
+    c_e, zone = _exposure_factor(height, displacement, distance_to_shore, TerrainType(terrain_type))
+    return c_e, zone.name
+
+
+@lru_cache(maxsize=64)
+def _compute_qp(height: float, site_altitude: float, v_map: float,
+                distance_to_shore: Union[float, str], terrain_type: TerrainType,
+                distance_into_town: float) -> float:
+    """
+    Peak velocity pressure at a given height (P394 Stages 2-11)
+    
+    Same arithmetic as WindLoadCalculator.calculate_wind_loading, built on
+    its stateless stage kernels and memoized on the site inputs so repeated
+    runs over the same site (e.g. circular vs square post variants) reuse
+    the result.
+    
+    Returns:
+        Peak velocity pressure q_p (Pa)
+    """
+    distance = _parse_distance(distance_to_shore)
+    if not v_map:
+        # Default v_map; the sign centroid calculation reports the warning
+        v_map, _, _ = _vmap_lookup('')
+    c_alt = _altitude_factor(site_altitude, height)
+    c_e, _ = _exposure_coeffs(height, 0.0, distance, terrain_type)
+    if terrain_type == TerrainType.TOWN and distance_into_town > 0:
+        c_e_T = _town_correction(distance_into_town, height)
+    else:
+        c_e_T = 1.0
+    return _peak_velocity_pressure(v_map, c_alt, 1.0, c_e, c_e_T)
+
+
+def _post_core(q_p: float, c_s: float, c_d: float, c_f: float, A_ref: float,
+               q_p_post: float, c_f_post: float, A_post: float,
+               z_centroid: float, post_height: float) -> Tuple[float, ...]:
+    """
+    Numerical core of the post-mounted force and moment calculation
+    
+    Args:
+        q_p: Peak velocity pressure at sign centroid (Pa)
+        c_s, c_d, c_f: Size, dynamic and force coefficients for the sign
+        A_ref: Sign reference area (m²)
+        q_p_post: Peak velocity pressure at post mid-height (Pa)
+        c_f_post: Force coefficient for the post section
+        A_post: Post projected area (m²), 0 if post not specified
+        z_centroid: Height of sign centroid above ground (m)
+        post_height: Post height above ground (m)
+    
+    Returns:
+        (F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total) in kN and kNm
+    """
+    # Wind force on sign and post (Pa * m² = N, /1000 = kN)
+    F_w_sign = q_p * c_s * c_d * c_f * A_ref / 1000
+    F_w_post = q_p_post * c_f_post * A_post / 1000
+    F_w_total = F_w_sign + F_w_post
+    
+    # Overturning moment at ground level
+    M_sign = F_w_sign * z_centroid
+    M_post = F_w_post * (post_height / 2) if F_w_post > 0 else 0
+    M_total = M_sign + M_post
+    
+    return F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total
+
+
+def _post_section(size_out: float, t: float, section_type: SectionType,
+                  material: PostMaterial) -> Tuple[float, float, float]:
+    """
+    Section properties of the post (solid for timber, hollow otherwise)
+    
+    Returns:
+        (I, W_el, A) in mm⁴, mm³, mm²
+    """
+    # Check if solid section (timber) or hollow (steel/aluminium)
+    is_solid = (material == PostMaterial.TIMBER)
+    
+    if section_type == SectionType.SQUARE:
+        b_out = size_out
+        
+        if is_solid:
+            # Solid square section
+            I = b_out**4 / 12
+            W_el = b_out**3 / 6
+            A = b_out**2
+        else:
+            # Square hollow section (SHS)
+            b_in = b_out - 2 * t
+            I = (b_out**4 - b_in**4) / 12
+            W_el = I / (b_out / 2)
+            A = b_out**2 - b_in**2
+        
+    else:  # circular
+        D_out = size_out
+        
+        if is_solid:
+            # Solid circular section
+            I = math.pi * D_out**4 / 64
+            W_el = math.pi * D_out**3 / 32
+            A = math.pi * D_out**2 / 4
+        else:
+            # Circular hollow section (CHS)
+            D_in = D_out - 2 * t
+            I = math.pi * (D_out**4 - D_in**4) / 64
+            W_el = I / (D_out / 2)
+            A = math.pi * (D_out**2 - D_in**2) / 4
+    
+    return I, W_el, A
+
+
+def _post_resistance(f_y: float, material: PostMaterial) -> Tuple[float, float]:
+    """
+    Design bending and shear resistance of the post material
+    
+    Returns:
+        (sigma_Rd, tau_Rd) in N/mm²
+    """
+    if material == PostMaterial.STEEL:
+        gamma_M0 = 1.0
+        sigma_Rd = f_y / gamma_M0
+        tau_Rd = (f_y / _SQRT3) / gamma_M0
+    elif material == PostMaterial.ALUMINIUM:
+        gamma_M1 = 1.1  # EN 1999-1-1
+        sigma_Rd = f_y / gamma_M1
+        tau_Rd = (f_y / _SQRT3) / gamma_M1
+    else:  # timber
+        gamma_M = 1.3  # EN 1995-1-1
+        k_mod = 0.9  # Medium-term loading (wind)
+        sigma_Rd = (f_y * k_mod) / gamma_M
+        # For timber, shear strength is different (typically ~3-4 N/mm² for softwood)
+        f_v_k = 4.0  # Conservative for C24
+        tau_Rd = (f_v_k * k_mod) / gamma_M
+    
+    return sigma_Rd, tau_Rd
+
+
+def _post_utilization(M: float, F: float, W_el: float, A: float,
+                      sigma_Rd: float, tau_Rd: float) -> Tuple[float, ...]:
+    """
+    Bending and shear utilization of the post at its base
+    
+    Returns:
+        (sigma_Ed, eta_bending, tau_Ed, eta_shear)
+    """
+    # Bending stress (N/mm²)
+    M_Nmm = M * 1e6  # kNm to Nmm
+    sigma_Ed = M_Nmm / W_el if W_el > 0 else 999999
+    eta_bending = sigma_Ed / sigma_Rd if sigma_Rd > 0 else 999
+    
+    # Shear stress (simplified)
+    tau_Ed = (F * 1000) / A if A > 0 else 999999
+    eta_shear = tau_Ed / tau_Rd if tau_Rd > 0 else 999
+    
+    return sigma_Ed, eta_bending, tau_Ed, eta_shear
+
+
+def _post_full(q_p: float, c_s: float, c_d: float, c_f: float, A_ref: float,
+               q_p_post: float, c_f_post: float, A_post: float,
+               z_centroid: float, post_height: float,
+               W_el: float, A: float, sigma_Rd: float, tau_Rd: float) -> Tuple[float, ...]:
+    """
+    Forces, moments and post utilization in one pass
+    
+    _post_core followed by _post_utilization on the base moment and shear,
+    without building intermediate result dicts.
+    
+    Returns:
+        (F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total,
+         sigma_Ed, eta_bending, tau_Ed, eta_shear)
+    """
+    F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total = _post_core(
+        q_p, c_s, c_d, c_f, A_ref,
+        q_p_post, c_f_post, A_post,
+        z_centroid, post_height
+    )
+    sigma_Ed, eta_bending, tau_Ed, eta_shear = _post_utilization(
+        M_total, F_w_total, W_el, A, sigma_Rd, tau_Rd
+    )
+    return (F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total,
+            sigma_Ed, eta_bending, tau_Ed, eta_shear)
 
 
 class PostMountedCalculator(WindLoadCalculator):
@@ -31,12 +311,13 @@ class PostMountedCalculator(WindLoadCalculator):
         super().__init__()
         self.sign_type = "post_mounted"
     
-    def calculate_wind_loading(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_wind_loading(self,
+                               inputs: Union[PostMountedInputs, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Main calculation method for post-mounted sign wind loading
         
         Args:
-            inputs: Dictionary containing:
+            inputs: PostMountedInputs, or a dictionary with the same keys:
                 - sign_width (b): Width (m)
                 - sign_height (h): Height (m)
                 - sign_depth (d): Depth/thickness (m)
@@ -45,12 +326,12 @@ class PostMountedCalculator(WindLoadCalculator):
                 - site_altitude: Altitude above sea level (m)
                 - v_map: Fundamental wind speed (m/s)
                 - distance_to_shore: Distance to coast (km)
-                - terrain_type: 'sea', 'country', 'town'
+                - terrain_type: TerrainType (or 'sea', 'country', 'town')
                 - distance_into_town: Distance into town (km) if terrain='town'
                 - post_diameter: Post outer diameter (mm) for circular, or width for square
                 - post_thickness: Post wall thickness (mm)
-                - post_section_type: 'circular' or 'square' (default: 'circular')
-                - post_material: 'steel', 'aluminium', or 'timber' (default: 'steel')
+                - post_section_type: SectionType (or 'circular', 'square'; default circular)
+                - post_material: PostMaterial (or 'steel', 'aluminium', 'timber'; default steel)
                 - post_steel_grade: Material strength (N/mm²) - yield for steel/alu, bending for timber
                 - foundation_type: 'concrete', 'steel_base'
                 - embedment_depth: Foundation depth (m)
@@ -60,32 +341,42 @@ class PostMountedCalculator(WindLoadCalculator):
         """
         self.warnings = []
         
+        if isinstance(inputs, dict):
+            inputs = PostMountedInputs.from_dict(inputs)
+        
         # Extract inputs
-        b = inputs['sign_width']
-        h = inputs['sign_height']
-        d = inputs['sign_depth']
-        z_base = inputs['sign_base_height']
+        b = inputs.sign_width
+        h = inputs.sign_height
+        d = inputs.sign_depth
+        z_base = inputs.sign_base_height
         z_top = z_base + h
         z_centroid = z_base + h / 2
         
         # Calculate wind loading using parent class methodology
         # Use centroid height for wind pressure
-        wind_inputs = {
-            'sign_width': b,
-            'sign_height': h,
-            'sign_depth': d,
-            'building_height': z_centroid,  # Use centroid for pressure
-            'site_altitude': inputs['site_altitude'],
-            'v_map': inputs['v_map'],
-            'distance_to_shore': inputs['distance_to_shore'],
-            'terrain_type': inputs['terrain_type'],
-            'distance_into_town': inputs.get('distance_into_town', 0),
-            'mounting_type': 'post_mounted'
-        }
+        wind_inputs = WindInputs(
+            sign_width=b,
+            sign_height=h,
+            sign_depth=d,
+            building_height=z_centroid,  # Use centroid for pressure
+            site_altitude=inputs.site_altitude,
+            v_map=inputs.v_map,
+            distance_to_shore=inputs.distance_to_shore,
+            terrain_type=inputs.terrain_type,
+            distance_into_town=inputs.distance_into_town,
+            mounting_type='post_mounted'
+        )
         
         # Get base wind loading calculation
         base_results = super().calculate_wind_loading(wind_inputs)
         
+        # The wall-mounted c_f is not used for a free-standing sign, so its
+        # h/d warning is dropped; calculate_force_coefficient_freestanding
+        # raises its own
+        if base_results.warning_flags & WindWarning.HD_EXCEEDED:
+            hd_warning = WindWarning.HD_EXCEEDED.render(h_over_d=h / d)[0]
+            self.warnings[:] = [w for w in self.warnings if w != hd_warning]
+        
         # Extract key values (q_p is in Pa from parent class)
         q_p = base_results['q_p']  # Pa
         c_s = base_results['c_s']
@@ -99,64 +390,66 @@ class PostMountedCalculator(WindLoadCalculator):
         # Reference area
         A_ref = b * h
         
-        # Wind force on sign (N, then convert to kN)
-        F_w_sign = q_p * c_s * c_d * c_f * A_ref / 1000  # Pa * m² = N, /1000 = kN
-        
-        # Wind force on post (if significant)
-        post_size = inputs.get('post_diameter', 0) / 1000  # mm to m (diameter or width)
-        post_height = inputs.get('post_height', z_top)
-        post_section_type = inputs.get('post_section_type', 'circular')
+        # Wind on post (if significant)
+        post_size = (inputs.post_diameter or 0) / 1000  # mm to m (diameter or width)
+        post_height = inputs.post_height if inputs.post_height is not None else z_top
         
         if post_size > 0:
             # Force coefficient depends on section type
-            if post_section_type == 'square':
-                c_f_post = 2.0  # Sharp-edged square section (conservative)
-            else:  # circular
-                c_f_post = 0.7  # Circular cylinder (P394 Table 5.4)
+            c_f_post = _C_F_POST[inputs.post_section_type]
             
             A_post = post_size * post_height
             
             # Use average wind pressure over post height
             z_post_avg = post_height / 2
-            wind_inputs_post = wind_inputs.copy()
-            wind_inputs_post['building_height'] = z_post_avg
-            post_results = super().calculate_wind_loading(wind_inputs_post)
-            q_p_post = post_results['q_p']  # Pa
-            
-            F_w_post = q_p_post * c_f_post * A_post / 1000  # Pa * m² = N, /1000 = kN
+            q_p_post = _compute_qp(
+                z_post_avg,
+                inputs.site_altitude,
+                inputs.v_map,
+                inputs.distance_to_shore,
+                inputs.terrain_type,
+                inputs.distance_into_town
+            )  # Pa
         else:
-            F_w_post = 0
+            c_f_post = A_post = q_p_post = 0.0
             self.warnings.append("Post diameter not specified - post wind force neglected")
         
-        # Total wind force
-        F_w_total = F_w_sign + F_w_post
-        
-        # Overturning moment at ground level
-        M_sign = F_w_sign * z_centroid
-        M_post = F_w_post * (post_height / 2) if F_w_post > 0 else 0
-        M_total = M_sign + M_post
-        
-        # Post stress check (if details provided)
+        # Forces (kN), overturning moments at ground level (kNm) and, if
+        # post details are provided, the post stress check
         post_check = None
-        if 'post_diameter' in inputs and 'post_thickness' in inputs:
-            post_check = self.calculate_post_stresses(
-                M_total,
-                F_w_total,
-                inputs['post_diameter'],
-                inputs['post_thickness'],
-                inputs.get('post_steel_grade', 275),
-                inputs.get('post_section_type', 'circular'),
-                inputs.get('post_material', 'steel')
+        if inputs.post_diameter is not None and inputs.post_thickness is not None:
+            I, W_el, A = _post_section(
+                inputs.post_diameter,
+                inputs.post_thickness,
+                inputs.post_section_type,
+                inputs.post_material
+            )
+            sigma_Rd, tau_Rd = _post_resistance(inputs.post_steel_grade, inputs.post_material)
+            (F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total,
+             sigma_Ed, eta_bending, tau_Ed, eta_shear) = _post_full(
+                q_p, c_s, c_d, c_f, A_ref,
+                q_p_post, c_f_post, A_post,
+                z_centroid, post_height,
+                W_el, A, sigma_Rd, tau_Rd
+            )
+            post_check = self._post_check_dict(
+                I, W_el, sigma_Ed, sigma_Rd, eta_bending, tau_Ed, tau_Rd, eta_shear
+            )
+        else:
+            F_w_sign, F_w_post, F_w_total, M_sign, M_post, M_total = _post_core(
+                q_p, c_s, c_d, c_f, A_ref,
+                q_p_post, c_f_post, A_post,
+                z_centroid, post_height
             )
         
         # Foundation check (simplified)
         foundation_check = None
-        if 'embedment_depth' in inputs:
+        if inputs.embedment_depth is not None:
             foundation_check = self.calculate_foundation_requirements(
                 M_total,
                 F_w_total,
-                inputs['embedment_depth'],
-                inputs.get('foundation_type', 'concrete')
+                inputs.embedment_depth,
+                inputs.foundation_type
             )
         
         # Overall assessment
@@ -173,7 +466,7 @@ class PostMountedCalculator(WindLoadCalculator):
             'mounting_type': 'post_mounted',
             
             # Inherit base results
-            **base_results,
+            **base_results.to_dict(),
             
             # Override/add specific values
             'q_p': q_p,  # Keep in Pa for consistency
@@ -208,6 +501,19 @@ class PostMountedCalculator(WindLoadCalculator):
         
         return results
     
+    def calculate_exposure_factor(self,
+                                  height: float,
+                                  displacement: float,
+                                  distance_to_shore: float,
+                                  terrain_type: TerrainType) -> Tuple[float, str]:
+        """
+        Exposure factor c_e (Figure NA.7), served from the module-level cache
+        
+        Same result as WindLoadCalculator.calculate_exposure_factor; the
+        parent calculation picks this up for the sign centroid pressure.
+        """
+        return _exposure_coeffs(height, displacement, distance_to_shore, terrain_type)
+    
     def calculate_force_coefficient_freestanding(self, height: float, 
                                                  depth: float, width: float) -> float:
         """
@@ -227,10 +533,10 @@ class PostMountedCalculator(WindLoadCalculator):
         # Use similar formula to wall-mounted but slightly higher
         # Free-standing signs experience slightly higher forces
         if 0.25 <= h_over_d <= 1:
-            c_f = 0.935 + 0.1839 * np.log(h_over_d)
+            c_f = 0.935 + 0.1839 * math.log(h_over_d)
             c_f *= 1.1  # 10% increase for free-standing
         elif 1 < h_over_d <= 5:
-            c_f = (0.8125 + 0.0375 * h_over_d) * (1.1 + 0.1243 * np.log(h_over_d))
+            c_f = (0.8125 + 0.0375 * h_over_d) * (1.1 + 0.1243 * math.log(h_over_d))
             c_f *= 1.1  # 10% increase for free-standing
         elif h_over_d < 0.25:
             c_f = 0.68 * 1.1
@@ -241,8 +547,9 @@ class PostMountedCalculator(WindLoadCalculator):
         return c_f
     
     def calculate_post_stresses(self, M: float, F: float, size_out: float, 
-                               t: float, f_y: float, section_type: str = 'circular',
-                               material: str = 'steel') -> Dict[str, Any]:
+                               t: float, f_y: float,
+                               section_type: SectionType = SectionType.CIRCULAR,
+                               material: PostMaterial = PostMaterial.STEEL) -> Dict[str, Any]:
         """
         Calculate stresses in hollow section post (circular or square)
         EN 1993-1-1 (steel/aluminium), EN 1995-1-1 (timber)
@@ -253,73 +560,30 @@ class PostMountedCalculator(WindLoadCalculator):
             size_out: Outer diameter (circular) or width (square) (mm)
             t: Wall thickness (mm)
             f_y: Material strength (N/mm²) - yield for steel/alu, bending for timber
-            section_type: 'circular' or 'square'
-            material: 'steel', 'aluminium', or 'timber'
+            section_type: SectionType (or 'circular', 'square')
+            material: PostMaterial (or 'steel', 'aluminium', 'timber')
         
         Returns:
             Dictionary with stress checks
         """
-        # Check if solid section (timber) or hollow (steel/aluminium)
-        is_solid = (material == 'timber')
-        
-        if section_type == 'square':
-            b_out = size_out
-            
-            if is_solid:
-                # Solid square section
-                I = b_out**4 / 12
-                W_el = b_out**3 / 6
-                A = b_out**2
-            else:
-                # Square hollow section (SHS)
-                b_in = b_out - 2 * t
-                I = (b_out**4 - b_in**4) / 12
-                W_el = I / (b_out / 2)
-                A = b_out**2 - b_in**2
-            
-        else:  # circular
-            D_out = size_out
-            
-            if is_solid:
-                # Solid circular section
-                I = np.pi * D_out**4 / 64
-                W_el = np.pi * D_out**3 / 32
-                A = np.pi * D_out**2 / 4
-            else:
-                # Circular hollow section (CHS)
-                D_in = D_out - 2 * t
-                I = np.pi * (D_out**4 - D_in**4) / 64
-                W_el = I / (D_out / 2)
-                A = np.pi * (D_out**2 - D_in**2) / 4
-        
-        # Bending stress (N/mm²)
-        M_Nmm = M * 1e6  # kNm to Nmm
-        sigma_Ed = M_Nmm / W_el if W_el > 0 else 999999
-        
-        # Design resistance depends on material
-        if material == 'steel':
-            gamma_M0 = 1.0
-            sigma_Rd = f_y / gamma_M0
-            tau_Rd = (f_y / np.sqrt(3)) / gamma_M0
-        elif material == 'aluminium':
-            gamma_M1 = 1.1  # EN 1999-1-1
-            sigma_Rd = f_y / gamma_M1
-            tau_Rd = (f_y / np.sqrt(3)) / gamma_M1
-        else:  # timber
-            gamma_M = 1.3  # EN 1995-1-1
-            k_mod = 0.9  # Medium-term loading (wind)
-            sigma_Rd = (f_y * k_mod) / gamma_M
-            # For timber, shear strength is different (typically ~3-4 N/mm² for softwood)
-            f_v_k = 4.0  # Conservative for C24
-            tau_Rd = (f_v_k * k_mod) / gamma_M
-        
-        # Utilization
-        eta_bending = sigma_Ed / sigma_Rd if sigma_Rd > 0 else 999
-        
-        # Shear stress (simplified)
-        tau_Ed = (F * 1000) / A if A > 0 else 999999
-        eta_shear = tau_Ed / tau_Rd if tau_Rd > 0 else 999
-        
+        section_type = SectionType(section_type)
+        material = PostMaterial(material)
+        
+        I, W_el, A = _post_section(size_out, t, section_type, material)
+        sigma_Rd, tau_Rd = _post_resistance(f_y, material)
+        sigma_Ed, eta_bending, tau_Ed, eta_shear = _post_utilization(
+            M, F, W_el, A, sigma_Rd, tau_Rd
+        )
+        
+        return self._post_check_dict(
+            I, W_el, sigma_Ed, sigma_Rd, eta_bending, tau_Ed, tau_Rd, eta_shear
+        )
+    
+    @staticmethod
+    def _post_check_dict(I: float, W_el: float, sigma_Ed: float, sigma_Rd: float,
+                         eta_bending: float, tau_Ed: float, tau_Rd: float,
+                         eta_shear: float) -> Dict[str, Any]:
+        """Package post stress results in the post_check dictionary format"""
         return {
             'I': I,
             'W_el': W_el,
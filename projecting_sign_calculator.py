@@ -10,8 +10,110 @@ Standard: EN 1991-1-4:2005 + UK National Annex
 Version: 1.0.0
 """
 
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Any
+from dataclasses import dataclass, fields, MISSING
+from typing import Dict, List, Tuple, Any, Union
+
+
+# Shear yield factor, evaluated once at import rather than per check
+_SQRT3 = math.sqrt(3)
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectingSignInputs:
+    """
+    Inputs for ProjectingSignCalculator.calculate_wind_loading
+    
+    Field names match the keys of the legacy input dictionary; see
+    calculate_wind_loading for units.
+    """
+    sign_width: float
+    sign_height: float
+    projection: float
+    mounting_height: float
+    terrain_category: str
+    v_b_0: float
+    sign_weight: float
+    n_brackets: int
+    bracket_spacing: float
+    n_fixings_per_bracket: int
+    fixing_pitch_vertical: float
+    anchor_tension_capacity: float
+    anchor_shear_capacity: float
+    anchor_gamma_M: float
+    bracket_width: float
+    bracket_depth: float
+    bracket_thickness: float
+    bracket_steel_grade: float
+    c_dir: float = 1.0
+    c_season: float = 1.0
+    
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'ProjectingSignInputs':
+        """Build from an input dictionary (raises KeyError for missing required keys)"""
+        kwargs = {}
+        for f in fields(cls):
+            if f.name in d:
+                kwargs[f.name] = d[f.name]
+            elif f.default is MISSING:
+                raise KeyError(f.name)
+        return cls(**kwargs)
+
+
+# Stage kernels: plain float -> float functions shared by _wind_core and
+# the ProjectingSignCalculator methods that delegate to them
+
+def _basic_wind_velocity(v_b_0: float, c_dir: float, c_season: float) -> float:
+    """Basic wind velocity v_b (calculate_basic_wind_velocity)"""
+    return v_b_0 * c_dir * c_season
+
+
+def _roughness_factor(z: float, z_0: float, k_r: float) -> float:
+    """Roughness factor c_r(z) (calculate_roughness_factor)"""
+    return k_r * math.log(z / z_0)
+
+
+def _turbulence_intensity(z: float, z_0: float, k_I: float = 1.0, c_0: float = 1.0) -> float:
+    """Turbulence intensity I_v(z) (calculate_turbulence_intensity)"""
+    return k_I / (c_0 * math.log(z / z_0))
+
+
+def _peak_pressure(v_m: float, I_v: float, air_density: float) -> float:
+    """Peak velocity pressure q_p in kN/m² (calculate_peak_pressure)"""
+    q_p_Pa = 0.5 * air_density * v_m**2 * (1 + 7 * I_v)
+    return q_p_Pa / 1000  # Convert Pa to kN/m²
+
+
+def _wind_core(b: float, h: float, z: float,
+               z_0: float, z_min: float, k_r: float,
+               v_b_0: float, c_dir: float, c_season: float,
+               c_f: float, G_k: float, air_density: float,
+               gamma_G: float, gamma_Q: float) -> Tuple[float, ...]:
+    """
+    Numerical core of the projecting sign wind calculation (Stages 1-4)
+    
+    Chains the stage kernels above (k_I = 1.0, c_0 = 1.0) and applies
+    the ULS factors.
+    
+    Returns:
+        (v_b, z_eff, c_r, I_v, v_m, q_p, A, F_w_k, G_Ed, F_w_Ed)
+        q_p in kN/m², forces in kN
+    """
+    v_b = _basic_wind_velocity(v_b_0, c_dir, c_season)
+    
+    z_eff = max(z, z_min)
+    c_r = _roughness_factor(z_eff, z_0, k_r)
+    I_v = _turbulence_intensity(z_eff, z_0)
+    v_m = c_r * v_b
+    q_p = _peak_pressure(v_m, I_v, air_density)
+    
+    A = b * h
+    F_w_k = c_f * q_p * A
+    G_Ed = gamma_G * G_k
+    F_w_Ed = gamma_Q * F_w_k
+    
+    return v_b, z_eff, c_r, I_v, v_m, q_p, A, F_w_k, G_Ed, F_w_Ed
 
 
 class ProjectingSignCalculator:
@@ -40,6 +142,11 @@ class ProjectingSignCalculator:
         'IV': {'z_0': 1.0, 'z_min': 10, 'k_r': 0.24, 'description': 'Urban centres'}
     }
     
+    # (z_0, z_min, k_r) per category, unpacked straight into _wind_core
+    TERRAIN_KERNEL_ARGS = {
+        cat: (p['z_0'], p['z_min'], p['k_r']) for cat, p in TERRAIN_PARAMS.items()
+    }
+    
     # Partial factors (EN 1990)
     GAMMA_G_UNFAV = 1.35  # Permanent actions (unfavorable)
     GAMMA_G_FAV = 1.0     # Permanent actions (favorable)
@@ -51,12 +158,13 @@ class ProjectingSignCalculator:
         self.methodology = "EN 1991-1-4:2005"
         self.version = "1.0.0"
     
-    def calculate_wind_loading(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_wind_loading(self,
+                               inputs: Union[ProjectingSignInputs, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Main calculation method for projecting sign wind loading
         
         Args:
-            inputs: Dictionary containing:
+            inputs: ProjectingSignInputs, or a dictionary with the same keys:
                 - sign_width (b): Width parallel to wall (m)
                 - sign_height (h): Height (m)
                 - projection (e): Distance from wall to sign centroid (m)
@@ -83,55 +191,47 @@ class ProjectingSignCalculator:
         """
         self.warnings = []
         
+        if isinstance(inputs, dict):
+            inputs = ProjectingSignInputs.from_dict(inputs)
+        
         # Extract inputs
-        b = inputs['sign_width']
-        h = inputs['sign_height']
-        e = inputs['projection']
-        z = inputs['mounting_height']
-        terrain = inputs['terrain_category']
-        v_b_0 = inputs['v_b_0']
-        c_dir = inputs.get('c_dir', 1.0)
-        c_season = inputs.get('c_season', 1.0)
-        
-        # Stage 1: Basic wind velocity
-        v_b = self.calculate_basic_wind_velocity(v_b_0, c_dir, c_season)
-        
-        # Stage 2: Peak velocity pressure at sign height
+        b = inputs.sign_width
+        h = inputs.sign_height
+        e = inputs.projection
+        z = inputs.mounting_height
+        terrain = inputs.terrain_category
+        v_b_0 = inputs.v_b_0
+        c_dir = inputs.c_dir
+        c_season = inputs.c_season
+        
+        # Stages 1-4: Basic wind velocity, peak velocity pressure at sign
+        # height, wind force on sign and ULS design actions
         terrain_params = self.TERRAIN_PARAMS[terrain]
-        z_0 = terrain_params['z_0']
-        z_min = terrain_params['z_min']
-        k_r = terrain_params['k_r']
-        
-        z_eff = max(z, z_min)
-        c_r = self.calculate_roughness_factor(z_eff, z_0, k_r)
-        I_v = self.calculate_turbulence_intensity(z_eff, z_0)
-        v_m = c_r * v_b  # c_0 = 1.0 (flat terrain)
-        q_p = self.calculate_peak_pressure(v_m, I_v)
-        
-        # Stage 3: Wind force on sign
-        A = b * h
         c_f = 2.0  # Force coefficient for flat plate perpendicular to wind
-        F_w_k = c_f * q_p * A  # Characteristic wind force (kN)
         
-        # Stage 4: ULS design actions
-        G_k = inputs['sign_weight']
-        G_Ed = self.GAMMA_G_UNFAV * G_k
-        F_w_Ed = self.GAMMA_Q * F_w_k
+        (v_b, z_eff, c_r, I_v, v_m, q_p,
+         A, F_w_k, G_Ed, F_w_Ed) = _wind_core(
+            b, h, z,
+            *self.TERRAIN_KERNEL_ARGS[terrain],
+            v_b_0, c_dir, c_season,
+            c_f, inputs.sign_weight, self.AIR_DENSITY,
+            self.GAMMA_G_UNFAV, self.GAMMA_Q
+        )
         
         # Stage 5: Bracket forces
-        n_brackets = inputs['n_brackets']
-        s = inputs['bracket_spacing']
+        n_brackets = inputs.n_brackets
+        s = inputs.bracket_spacing
         
         bracket_forces = self.calculate_bracket_forces(
             F_w_Ed, e, n_brackets, s, G_Ed
         )
         
         # Stage 6: Anchor verification
-        n_fix = inputs['n_fixings_per_bracket']
-        p_v = inputs['fixing_pitch_vertical']
-        N_Rk = inputs['anchor_tension_capacity']
-        V_Rk = inputs['anchor_shear_capacity']
-        gamma_M = inputs['anchor_gamma_M']
+        n_fix = inputs.n_fixings_per_bracket
+        p_v = inputs.fixing_pitch_vertical
+        N_Rk = inputs.anchor_tension_capacity
+        V_Rk = inputs.anchor_shear_capacity
+        gamma_M = inputs.anchor_gamma_M
         
         anchor_check = self.calculate_anchor_utilization(
             bracket_forces['V_per_bracket'],
@@ -141,10 +241,10 @@ class ProjectingSignCalculator:
         )
         
         # Stage 7: Bracket member verification
-        b_out = inputs['bracket_width']
-        h_out = inputs['bracket_depth']
-        t = inputs['bracket_thickness']
-        f_y = inputs['bracket_steel_grade']
+        b_out = inputs.bracket_width
+        h_out = inputs.bracket_depth
+        t = inputs.bracket_thickness
+        f_y = inputs.bracket_steel_grade
         
         section = {'b_out': b_out, 'h_out': h_out, 't': t}
         bracket_check = self.calculate_bracket_stresses(
@@ -230,7 +330,7 @@ class ProjectingSignCalculator:
         Returns:
             Basic wind velocity v_b (m/s)
         """
-        return v_b_0 * c_dir * c_season
+        return _basic_wind_velocity(v_b_0, c_dir, c_season)
     
     def calculate_roughness_factor(self, z: float, z_0: float, k_r: float) -> float:
         """
@@ -245,7 +345,7 @@ class ProjectingSignCalculator:
         Returns:
             Roughness factor c_r(z)
         """
-        return k_r * np.log(z / z_0)
+        return _roughness_factor(z, z_0, k_r)
     
     def calculate_turbulence_intensity(self, z: float, z_0: float, 
                                       k_I: float = 1.0, c_0: float = 1.0) -> float:
@@ -262,7 +362,7 @@ class ProjectingSignCalculator:
         Returns:
             Turbulence intensity I_v(z)
         """
-        return k_I / (c_0 * np.log(z / z_0))
+        return _turbulence_intensity(z, z_0, k_I, c_0)
     
     def calculate_peak_pressure(self, v_m: float, I_v: float) -> float:
         """
@@ -276,8 +376,7 @@ class ProjectingSignCalculator:
         Returns:
             Peak velocity pressure q_p (kN/m²)
         """
-        q_p_Pa = 0.5 * self.AIR_DENSITY * v_m**2 * (1 + 7 * I_v)
-        return q_p_Pa / 1000  # Convert Pa to kN/m²
+        return _peak_pressure(v_m, I_v, self.AIR_DENSITY)
     
     def calculate_bracket_forces(self, F_w_Ed: float, e: float, 
                                 n_brackets: int, s: float, G_Ed: float) -> Dict[str, float]:
@@ -373,6 +472,37 @@ class ProjectingSignCalculator:
             'combined_status': 'PASS' if eta_combined <= 1.0 else 'FAIL'
         }
     
+    def check_anchor_batch(self, V_per_bracket, M_per_bracket, N_vertical,
+                           n_fix: int, p_v: float, N_Rk: float, V_Rk: float,
+                           gamma_M: float) -> np.ndarray:
+        """
+        Vectorised anchor utilization over arrays of bracket actions
+        
+        Same interaction as calculate_anchor_utilization, evaluated in one
+        NumPy pass - e.g. over the bracket actions for n_brackets = 1..4.
+        
+        Args:
+            V_per_bracket: Shear force per bracket (kN), array-like
+            M_per_bracket: Moment per bracket (kNm), array-like
+            N_vertical: Vertical load per bracket (kN), array-like
+            n_fix, p_v, N_Rk, V_Rk, gamma_M: As calculate_anchor_utilization
+        
+        Returns:
+            Array of shape (..., 3): eta_tension, eta_shear, eta_combined
+        """
+        V_Ed = np.asarray(V_per_bracket, dtype=np.float64) / n_fix
+        N_Ed = (np.asarray(M_per_bracket, dtype=np.float64) / (p_v * (n_fix / 2))
+                + np.asarray(N_vertical, dtype=np.float64) / n_fix)
+        
+        N_Rd = N_Rk / gamma_M
+        V_Rd = V_Rk / gamma_M
+        
+        eta_tension = N_Ed / N_Rd if N_Rd > 0 else np.full_like(N_Ed, 999)
+        eta_shear = V_Ed / V_Rd if V_Rd > 0 else np.full_like(V_Ed, 999)
+        
+        # Linear interaction (conservative)
+        return np.stack([eta_tension, eta_shear, eta_tension + eta_shear], axis=-1)
+    
     def calculate_bracket_stresses(self, V_per_bracket: float, L: float,
                                    section: Dict[str, float], f_y: float) -> Dict[str, float]:
         """
@@ -423,7 +553,7 @@ class ProjectingSignCalculator:
         tau_Ed = V_Ed_N / A_v if A_v > 0 else 999999
         
         # Shear resistance (N/mm²)
-        tau_Rd = (f_y / np.sqrt(3)) / gamma_M0
+        tau_Rd = (f_y / _SQRT3) / gamma_M0
         
         # Shear utilization
         eta_shear = tau_Ed / tau_Rd if tau_Rd > 0 else 999
@@ -5,65 +5,222 @@ Based on BS 8442:2015 and EN 1999-1-1
 """
 
 import numpy as np
+from enum import IntEnum
+from types import MappingProxyType
 from typing import Dict, Any, List
 
 
+def _panel_math(L: float, q_p: float, E: float, I: float, W: float, f_y: float):
+    """
+    Simply supported panel strip between channels (pure float kernel)
+    
+    Args:
+        L: Channel spacing / span (mm)
+        q_p: Wind pressure (Pa)
+        E: Elastic modulus (MPa)
+        I: Second moment of area of the strip (mm⁴)
+        W: Section modulus of the strip (mm³)
+        f_y: Stress limit (MPa)
+    
+    Returns:
+        (delta, delta_limit, sigma, L_max_deflection, L_max_stress)
+        in mm, mm, MPa, mm, mm
+    """
+    # Distributed load on panel strip (N/mm)
+    # q_p is in Pa = N/m²
+    # For 1m wide strip: load = q_p N/m² × 1 m = q_p N/m
+    # Convert to N/mm: q_p N/m ÷ 1000 mm/m = q_p/1000 N/mm
+    w = q_p / 1000  # N/mm
+    
+    # Simply supported beam between channels
+    # Maximum deflection (center of span)
+    delta = (5 * w * L**4) / (384 * E * I)  # mm
+    
+    # Maximum bending moment
+    M_max = (w * L**2) / 8  # Nmm
+    
+    # Maximum bending stress
+    sigma = M_max / W if W > 0 else 999999  # MPa
+    
+    # Deflection limit (aesthetic)
+    delta_limit = L / 200  # mm (BS 8442 recommendation)
+    
+    # Calculate recommended maximum spacing
+    if delta > delta_limit:
+        # Work backwards from deflection limit
+        L_max_deflection = ((384 * E * I * delta_limit) / (5 * w)) ** 0.25
+    else:
+        L_max_deflection = L
+    
+    if sigma > f_y:
+        # Work backwards from stress limit
+        L_max_stress = ((8 * W * f_y) / w) ** 0.5
+    else:
+        L_max_stress = L
+    
+    return delta, delta_limit, sigma, L_max_deflection, L_max_stress
+
+
+def _deflection_stress(L, q_p, E, I, W):
+    """
+    Mid-span deflection and bending stress of a simply supported strip
+    (array kernel behind deflection_stress_vector, units as _panel_math)
+    
+    Returns:
+        (delta, sigma) in mm, MPa
+    """
+    L = np.asarray(L, dtype=np.float64)
+    w = np.asarray(q_p, dtype=np.float64) / 1000  # N/mm
+    
+    delta = (5 * w * L**4) / (384 * E * I)  # mm
+    sigma = (w * L**2) / 8 / W  # MPa
+    return delta, sigma
+
+
+def _panel_math_array(L, q_p, E, I, W, f_y):
+    """
+    Array form of _panel_math
+    
+    All arguments broadcast against each other, so a spacing vector, a
+    pressure vector and per-material property columns can be combined into
+    a full grid in one NumPy pass. Units as _panel_math.
+    
+    Returns:
+        (delta, delta_limit, sigma, L_max_deflection, L_max_stress) arrays
+    """
+    w = np.asarray(q_p, dtype=np.float64) / 1000  # N/mm
+    
+    delta, sigma = _deflection_stress(L, q_p, E, I, W)
+    delta_limit = L / 200  # mm
+    
+    with np.errstate(divide='ignore'):
+        L_max_deflection = np.where(
+            delta <= delta_limit, L, ((384 * E * I * delta_limit) / (5 * w)) ** 0.25
+        )
+        L_max_stress = np.where(sigma <= f_y, L, ((8 * W * f_y) / w) ** 0.5)
+    
+    return delta, delta_limit, sigma, L_max_deflection, L_max_stress
+
+
+# Panel material catalogue (read-only), SignConstructionCalculator.MATERIALS
+_MATERIALS = MappingProxyType({
+    'acm_3mm': {
+        'name': '3mm Aluminium Composite (ACM/Dibond)',
+        'thickness': 3.0,  # mm
+        't_face': 0.3,  # mm (aluminium skin thickness)
+        't_core': 2.4,  # mm (PE core)
+        'E_face': 70000,  # MPa (aluminium)
+        'E_core': 500,  # MPa (polyethylene - very low)
+        'f_y_face': 100,  # MPa (1050 aluminium, annealed)
+        'density': 5.0,  # kg/m²
+        # Sandwich panel: I ≈ 2 × E_face × t_face × (d/2)² where d = total thickness
+        # I = 2 × 70000 × 0.3 × (3/2)² = 94500 mm⁴ per 1000mm width = 94.5 mm⁴/mm
+        'I_per_width': 94.5,  # mm⁴/mm (effective, per unit width)
+        # W = I / (d/2) = 94.5 / 1.5 = 63 mm³/mm
+        'W_per_width': 63.0,  # mm³/mm (section modulus per unit width)
+    },
+    'aluminium_3mm': {
+        'name': '3mm Solid Aluminium 1050',
+        'thickness': 3.0,  # mm
+        'E': 70000,  # MPa
+        'f_y': 100,  # MPa (1050-H14)
+        'density': 8.1,  # kg/m²
+        'I_per_width': 2.25,  # mm⁴/mm (t³/12 per unit width)
+        'W_per_width': 1.5,  # mm³/mm (t²/6 per unit width)
+    },
+    'steel_composite_3mm': {
+        'name': '3mm Steel Composite Panel',
+        'thickness': 3.0,  # mm
+        't_face': 0.5,  # mm (steel skin thickness - typically thicker than ACM)
+        't_core': 2.0,  # mm (core material)
+        'E_face': 210000,  # MPa (steel)
+        'E_core': 500,  # MPa (polymer core)
+        'f_y_face': 235,  # MPa (mild steel)
+        'density': 12.0,  # kg/m² (heavier than aluminium)
+        # Sandwich panel: I = 2 × E_face × t_face × (d/2)²
+        # I = 2 × 210000 × 0.5 × (3/2)² = 472500 mm⁴ per 1000mm width = 472.5 mm⁴/mm
+        'I_per_width': 472.5,  # mm⁴/mm (much stiffer than ACM due to steel)
+        # W = I / (d/2) = 472.5 / 1.5 = 315 mm³/mm
+        'W_per_width': 315.0,  # mm³/mm (section modulus per unit width)
+    },
+    'aluminium_4mm': {
+        'name': '4mm Solid Aluminium 1050',
+        'thickness': 4.0,  # mm
+        'E': 70000,  # MPa
+        'f_y': 100,  # MPa
+        'density': 10.8,  # kg/m²
+        'I_per_width': 5.33,  # mm⁴/mm
+        'W_per_width': 2.67,  # mm³/mm
+    },
+})
+
+
+class PanelMaterial(IntEnum):
+    """Panel material id; the lower-case name is the MATERIALS key"""
+    ACM_3MM = 0
+    ALUMINIUM_3MM = 1
+    STEEL_COMPOSITE_3MM = 2
+    ALUMINIUM_4MM = 3
+
+
+def _material_columns(materials):
+    """
+    Build the struct-of-arrays material table from a material catalogue
+    
+    Args:
+        materials: Mapping of material key to property dict (see MATERIALS)
+    
+    Returns:
+        (names, t, E, I, W, f_y) - names tuple and read-only float64 columns
+        of thickness (mm), modulus (MPa), strip second moment of area (mm⁴),
+        strip section modulus (mm³) and stress limit (MPa), in catalogue order
+    """
+    strip_width = 1000  # mm, properties are for a 1m wide strip
+    names, columns = [], []
+    for key, material in materials.items():
+        if 'composite' in key or 'acm' in key:
+            # Composite panel - face material governs
+            E, f_y = material['E_face'], material['f_y_face']
+        else:
+            E, f_y = material['E'], material['f_y']
+        names.append(material['name'])
+        columns.append((
+            material['thickness'],
+            E,
+            material['I_per_width'] * strip_width,
+            material['W_per_width'] * strip_width,
+            f_y,
+        ))
+    
+    table = np.array(columns, dtype=np.float64).T
+    table.setflags(write=False)
+    return (tuple(names), *table)
+
+
+# Struct-of-arrays view of MATERIALS for the array paths: columns are
+# indexed by PanelMaterial ids (MATERIAL_IDS maps the string keys)
+MATERIAL_IDS = MappingProxyType(
+    {material.name.lower(): material for material in PanelMaterial}
+)
+MAT_NAMES, MAT_T, MAT_E, MAT_I, MAT_W, MAT_FY = _material_columns(
+    {key: _MATERIALS[key] for key in MATERIAL_IDS}
+)
+
+
 class SignConstructionCalculator:
     """
     Calculates structural adequacy of sign panel construction
     """
     
-    # Material properties database
-    MATERIALS = {
-        'acm_3mm': {
-            'name': '3mm Aluminium Composite (ACM/Dibond)',
-            'thickness': 3.0,  # mm
-            't_face': 0.3,  # mm (aluminium skin thickness)
-            't_core': 2.4,  # mm (PE core)
-            'E_face': 70000,  # MPa (aluminium)
-            'E_core': 500,  # MPa (polyethylene - very low)
-            'f_y_face': 100,  # MPa (1050 aluminium, annealed)
-            'density': 5.0,  # kg/m²
-            # Sandwich panel: I ≈ 2 × E_face × t_face × (d/2)² where d = total thickness
-            # I = 2 × 70000 × 0.3 × (3/2)² = 94500 mm⁴ per 1000mm width = 94.5 mm⁴/mm
-            'I_per_width': 94.5,  # mm⁴/mm (effective, per unit width)
-            # W = I / (d/2) = 94.5 / 1.5 = 63 mm³/mm
-            'W_per_width': 63.0,  # mm³/mm (section modulus per unit width)
-        },
-        'aluminium_3mm': {
-            'name': '3mm Solid Aluminium 1050',
-            'thickness': 3.0,  # mm
-            'E': 70000,  # MPa
-            'f_y': 100,  # MPa (1050-H14)
-            'density': 8.1,  # kg/m²
-            'I_per_width': 2.25,  # mm⁴/mm (t³/12 per unit width)
-            'W_per_width': 1.5,  # mm³/mm (t²/6 per unit width)
-        },
-        'steel_composite_3mm': {
-            'name': '3mm Steel Composite Panel',
-            'thickness': 3.0,  # mm
-            't_face': 0.5,  # mm (steel skin thickness - typically thicker than ACM)
-            't_core': 2.0,  # mm (core material)
-            'E_face': 210000,  # MPa (steel)
-            'E_core': 500,  # MPa (polymer core)
-            'f_y_face': 235,  # MPa (mild steel)
-            'density': 12.0,  # kg/m² (heavier than aluminium)
-            # Sandwich panel: I = 2 × E_face × t_face × (d/2)²
-            # I = 2 × 210000 × 0.5 × (3/2)² = 472500 mm⁴ per 1000mm width = 472.5 mm⁴/mm
-            'I_per_width': 472.5,  # mm⁴/mm (much stiffer than ACM due to steel)
-            # W = I / (d/2) = 472.5 / 1.5 = 315 mm³/mm
-            'W_per_width': 315.0,  # mm³/mm (section modulus per unit width)
-        },
-        'aluminium_4mm': {
-            'name': '4mm Solid Aluminium 1050',
-            'thickness': 4.0,  # mm
-            'E': 70000,  # MPa
-            'f_y': 100,  # MPa
-            'density': 10.8,  # kg/m²
-            'I_per_width': 5.33,  # mm⁴/mm
-            'W_per_width': 2.67,  # mm³/mm
-        },
-    }
+    # Material properties database (read-only)
+    MATERIALS = _MATERIALS
+    
+    # Quality-based channel spacing targets (mm)
+    QUALITY_TARGETS = MappingProxyType({
+        'highway': 300,
+        'professional': 400,
+        'budget': 600,
+    })
     
     def __init__(self):
         self.warnings = []
@@ -74,7 +231,7 @@ class SignConstructionCalculator:
         
         Args:
             inputs: Dictionary containing:
-                - panel_material: Material key from MATERIALS dict
+                - panel_material: PanelMaterial, or key from MATERIALS dict
                 - channel_spacing: Spacing between horizontal channels (mm)
                 - wind_pressure: Peak velocity pressure (Pa)
                 - sign_height: Total sign height (m) - for calculating number of channels
@@ -87,10 +244,7 @@ class SignConstructionCalculator:
         
         # Get material properties
         material_key = inputs.get('panel_material', 'acm_3mm')
-        if material_key not in self.MATERIALS:
-            raise ValueError(f"Unknown material: {material_key}")
-        
-        material = self.MATERIALS[material_key]
+        material, E, I, W, f_y = self._panel_properties(material_key)
         
         # Extract inputs
         L = inputs['channel_spacing']  # mm
@@ -98,65 +252,18 @@ class SignConstructionCalculator:
         sign_height = inputs.get('sign_height', 2.0) * 1000  # m to mm
         sign_width = inputs.get('sign_width', 3.0) * 1000  # m to mm
         
-        # Panel properties
-        if 'composite' in material_key or 'acm' in material_key:
-            # Composite panel - use effective properties
-            I_per_width = material['I_per_width']
-            W_per_width = material['W_per_width']
-            E = material['E_face']  # Use face material modulus
-            f_y = material['f_y_face']
-        else:
-            # Solid panel
-            I_per_width = material['I_per_width']
-            W_per_width = material['W_per_width']
-            E = material['E']
-            f_y = material['f_y']
-        
-        # Calculate for 1m wide strip of panel
-        strip_width = 1000  # mm
-        I = I_per_width * strip_width  # mm⁴
-        W = W_per_width * strip_width  # mm³
-        
-        # Distributed load on panel strip (N/mm)
-        # q_p is in Pa = N/m²
-        # For 1m wide strip: load = q_p N/m² × 1 m = q_p N/m
-        # Convert to N/mm: q_p N/m ÷ 1000 mm/m = q_p/1000 N/mm
-        w = q_p / 1000  # N/mm
-        
-        # Simply supported beam between channels
-        # Maximum deflection (center of span)
-        delta = (5 * w * L**4) / (384 * E * I)  # mm
-        
-        # Maximum bending moment
-        M_max = (w * L**2) / 8  # Nmm
-        
-        # Maximum bending stress
-        sigma = M_max / W if W > 0 else 999999  # MPa
-        
-        # Deflection limit (aesthetic)
-        delta_limit = L / 200  # mm (BS 8442 recommendation)
-        
         # Stress limit
         sigma_limit = f_y  # MPa
         
+        delta, delta_limit, sigma, L_max_deflection, L_max_stress = _panel_math(
+            L, q_p, E, I, W, sigma_limit
+        )
+        
         # Check results
         deflection_ok = delta <= delta_limit
         stress_ok = sigma <= sigma_limit
         overall_ok = deflection_ok and stress_ok
         
-        # Calculate recommended maximum spacing
-        if not deflection_ok:
-            # Work backwards from deflection limit
-            L_max_deflection = ((384 * E * I * delta_limit) / (5 * w)) ** 0.25
-        else:
-            L_max_deflection = L
-        
-        if not stress_ok:
-            # Work backwards from stress limit
-            L_max_stress = ((8 * W * sigma_limit) / w) ** 0.5
-        else:
-            L_max_stress = L
-        
         L_max_recommended = min(L_max_deflection, L_max_stress)
         
         # Calculate number of channels required
@@ -182,14 +289,7 @@ class SignConstructionCalculator:
             )
         
         # Add construction quality note
-        if L <= 300:
-            quality_note = "Highway/Professional grade construction"
-        elif L <= 450:
-            quality_note = "Good quality construction"
-        elif L <= 600:
-            quality_note = "Budget construction - marginal for high wind areas"
-        else:
-            quality_note = "Amateur construction - not recommended"
+        quality_note = self._quality_note(L)
         
         return {
             'material': material['name'],
@@ -216,6 +316,177 @@ class SignConstructionCalculator:
             'warnings': self.warnings
         }
     
+    def calculate_panel_adequacy_batch(self,
+                                       spacings,
+                                       wind_pressure: float,
+                                       sign_height: float = 2.0,
+                                       sign_width: float = 3.0,
+                                       panel_material: str = 'acm_3mm') -> Dict[str, Any]:
+        """
+        Vectorised panel check over an array of channel spacings
+        
+        Evaluates the same simply supported strip formulae as
+        calculate_panel_adequacy for every spacing in one NumPy pass.
+        
+        Args:
+            spacings: Channel spacings (mm), array-like
+            wind_pressure: Peak velocity pressure (Pa)
+            sign_height: Total sign height (m)
+            sign_width: Total sign width (m)
+            panel_material: Material key from MATERIALS dict
+        
+        Returns:
+            Dictionary of arrays (one element per spacing):
+                deflection, deflection_limit, deflection_ok,
+                stress, stress_ok, overall_ok, num_channels,
+                max_spacing_recommended, quality_note
+            plus scalar 'material' name and 'stress_limit'
+        """
+        material, E, I, W, f_y = self._panel_properties(panel_material)
+        
+        L = np.asarray(spacings, dtype=np.float64)  # mm
+        
+        delta, delta_limit, sigma, L_max_deflection, L_max_stress = _panel_math_array(
+            L, wind_pressure, E, I, W, f_y
+        )
+        
+        deflection_ok = delta <= delta_limit
+        stress_ok = sigma <= f_y
+        
+        num_spans = np.ceil(sign_height * 1000 / L)
+        num_channels = np.maximum(num_spans + 1, 2).astype(int)
+        
+        return {
+            'material': material['name'],
+            'channel_spacing': L,
+            'wind_pressure': wind_pressure,
+            'deflection': delta,
+            'deflection_limit': delta_limit,
+            'deflection_ok': deflection_ok,
+            'stress': sigma,
+            'stress_limit': f_y,
+            'stress_ok': stress_ok,
+            'overall_ok': deflection_ok & stress_ok,
+            'num_channels': num_channels,
+            'max_spacing_recommended': np.minimum(L_max_deflection, L_max_stress),
+            'quality_note': [self._quality_note(spacing) for spacing in L],
+        }
+    
+    @staticmethod
+    def deflection_stress_vector(L_mm, q_Pa, E_MPa, I_mm4, W_mm3):
+        """
+        Mid-span deflection and bending stress of a simply supported strip
+        
+        delta = 5 q L⁴ / 384 E I,  sigma = q L² / 8 W, evaluated as NumPy
+        expressions so any of the arguments may be arrays (e.g. spacings
+        against material columns for a 2-D table).
+        
+        Args:
+            L_mm: Span / channel spacing (mm)
+            q_Pa: Wind pressure (Pa) on a 1m wide strip
+            E_MPa: Elastic modulus (MPa)
+            I_mm4: Strip second moment of area (mm⁴)
+            W_mm3: Strip section modulus (mm³)
+        
+        Returns:
+            (delta_mm, sigma_MPa)
+        """
+        return _deflection_stress(L_mm, q_Pa, E_MPa, I_mm4, W_mm3)
+    
+    def calculate_panel_sweep(self,
+                              materials: List,
+                              spacings,
+                              wind_pressures) -> Dict[str, Any]:
+        """
+        Panel check over every (material, spacing, pressure) combination
+        
+        Materials are resolved to integer ids once and the property columns
+        gathered by id, then the whole grid is evaluated with broadcasting -
+        each combination is independent of the others.
+        
+        Args:
+            materials: PanelMaterial ids, or keys from MATERIALS
+            spacings: Channel spacings (mm), array-like
+            wind_pressures: Peak velocity pressures (Pa), array-like
+        
+        Returns:
+            Dictionary with 'material' names (one per material), the input
+            'channel_spacing' and 'wind_pressure' arrays, 'stress_limit' per
+            material, and arrays of shape (materials, spacings, pressures):
+                deflection, deflection_limit, deflection_ok,
+                stress, stress_ok, overall_ok, max_spacing_recommended
+        """
+        ids = np.array([self._material_id(m) for m in materials], dtype=np.intp)
+        names = [MAT_NAMES[i] for i in ids]
+        props = (MAT_E[ids], MAT_I[ids], MAT_W[ids], MAT_FY[ids])
+        
+        # Materials along axis 0, spacings along axis 1, pressures along axis 2
+        E, I, W, f_y = (col[:, None, None] for col in props)
+        L = np.asarray(spacings, dtype=np.float64)
+        q_p = np.asarray(wind_pressures, dtype=np.float64)
+        
+        delta, delta_limit, sigma, L_max_deflection, L_max_stress = _panel_math_array(
+            L[None, :, None], q_p[None, None, :], E, I, W, f_y
+        )
+        shape = (ids.size, L.size, q_p.size)
+        delta_limit = np.broadcast_to(delta_limit, shape)
+        
+        deflection_ok = delta <= delta_limit
+        stress_ok = sigma <= f_y
+        
+        return {
+            'material': names,
+            'channel_spacing': L,
+            'wind_pressure': q_p,
+            'deflection': delta,
+            'deflection_limit': delta_limit,
+            'deflection_ok': deflection_ok,
+            'stress': sigma,
+            'stress_limit': props[-1],
+            'stress_ok': stress_ok,
+            'overall_ok': deflection_ok & stress_ok,
+            'max_spacing_recommended': np.minimum(L_max_deflection, L_max_stress),
+        }
+    
+    def _panel_properties(self, material_key):
+        """
+        Look up effective properties of a 1m wide panel strip
+        
+        Args:
+            material_key: Material key from MATERIALS dict, or PanelMaterial
+        
+        Returns:
+            (material, E, I, W, f_y) - material dict, modulus (MPa),
+            second moment of area (mm⁴), section modulus (mm³), stress limit (MPa)
+        """
+        i = self._material_id(material_key)
+        material = self.MATERIALS[PanelMaterial(i).name.lower()]
+        E, I, W, f_y = MAT_E[i], MAT_I[i], MAT_W[i], MAT_FY[i]
+        
+        return material, E, I, W, f_y
+    
+    @staticmethod
+    def _material_id(material) -> 'PanelMaterial':
+        """Resolve a material key or integer id to its PanelMaterial"""
+        if isinstance(material, str):
+            material_id = MATERIAL_IDS.get(material)
+            if material_id is None:
+                raise ValueError(f"Unknown material: {material}")
+            return material_id
+        return PanelMaterial(material)
+    
+    @staticmethod
+    def _quality_note(L: float) -> str:
+        """Construction quality description for a channel spacing (mm)"""
+        if L <= 300:
+            return "Highway/Professional grade construction"
+        elif L <= 450:
+            return "Good quality construction"
+        elif L <= 600:
+            return "Budget construction - marginal for high wind areas"
+        else:
+            return "Amateur construction - not recommended"
+    
     def _calculate_num_channels(self, sign_height: float, spacing: float) -> int:
         """
         Calculate number of horizontal channels required
@@ -253,40 +524,31 @@ class SignConstructionCalculator:
         """
         material_key = inputs.get('panel_material', 'acm_3mm')
         q_p = inputs['wind_pressure']
-        sign_height = inputs.get('sign_height', 2.0)
+        sign_height = inputs.get('sign_height', 2.0) * 1000  # m to mm
         target_quality = inputs.get('target_quality', 'professional')
         
-        # Quality-based spacing targets
-        quality_targets = {
-            'highway': 300,  # mm
-            'professional': 400,  # mm
-            'budget': 600,  # mm
-        }
-        
-        target_spacing = quality_targets.get(target_quality, 400)
-        
-        # Check if target spacing is adequate
-        check_inputs = {
-            'panel_material': material_key,
-            'channel_spacing': target_spacing,
-            'wind_pressure': q_p,
-            'sign_height': sign_height,
-        }
+        target_spacing = self.QUALITY_TARGETS.get(target_quality, 400)
         
-        result = self.calculate_panel_adequacy(check_inputs)
+        # Check the target spacing; the maximum adequate spacing comes from
+        # inverting the deflection and stress formulae, so no search is needed
+        material, E, I, W, f_y = self._panel_properties(material_key)
+        delta, delta_limit, sigma, L_max_deflection, L_max_stress = _panel_math(
+            target_spacing, q_p, E, I, W, f_y
+        )
         
-        if result['overall_status'] == 'ADEQUATE':
+        if delta <= delta_limit and sigma <= f_y:
             return {
                 'recommended_spacing': target_spacing,
-                'num_channels': result['num_channels_current'],
+                'num_channels': self._calculate_num_channels(sign_height, target_spacing),
                 'status': 'ADEQUATE',
                 'quality': target_quality
             }
         else:
             # Use the calculated maximum spacing
+            L_max = min(L_max_deflection, L_max_stress)
             return {
-                'recommended_spacing': result['max_spacing_recommended'],
-                'num_channels': result['num_channels_recommended'],
+                'recommended_spacing': L_max,
+                'num_channels': self._calculate_num_channels(sign_height, L_max),
                 'status': 'REQUIRES_CLOSER_SPACING',
                 'quality': 'custom',
                 'note': f"Target {target_quality} spacing inadequate, using calculated maximum"
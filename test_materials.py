@@ -1,6 +1,7 @@
 """Test different post materials: Steel, Aluminium, Timber"""
 
-from post_mounted_calculator import PostMountedCalculator
+from wind_calculator import TerrainType
+from post_mounted_calculator import PostMountedCalculator, SectionType, PostMaterial
 
 calc = PostMountedCalculator()
 
@@ -14,7 +15,7 @@ base_inputs = {
     'site_altitude': 50,
     'v_map': 22.5,
     'distance_to_shore': 20,
-    'terrain_type': 'country',
+    'terrain_type': TerrainType.COUNTRY,
     'post_thickness': 8,
     'foundation_type': 'concrete',
     'embedment_depth': 1.5
@@ -24,58 +25,48 @@ print("="*70)
 print("POST MATERIAL COMPARISON")
 print("="*70)
 
-# Test 1: Steel CHS 150×8, S275
-print("\n1. STEEL - CHS 150×8, S275")
-inputs_steel = base_inputs.copy()
-inputs_steel.update({
-    'post_diameter': 150,
-    'post_section_type': 'circular',
-    'post_material': 'steel',
-    'post_steel_grade': 275
-})
-results_steel = calc.calculate_wind_loading(inputs_steel)
-print(f"   Design resistance:   {results_steel['post_check']['sigma_Rd']:.1f} N/mm²")
-print(f"   Bending stress:      {results_steel['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_steel['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_steel['post_check']['bending_status']}")
+# Material cases: (key, heading, resistance note, input overrides)
+cases = [
+    ('steel', "1. STEEL - CHS 150×8, S275", "", {
+        'post_diameter': 150,
+        'post_section_type': SectionType.CIRCULAR,
+        'post_material': PostMaterial.STEEL,
+        'post_steel_grade': 275
+    }),
+    ('aluminium', "2. ALUMINIUM - CHS 150×8, 6061-T6", " (γ_M1 = 1.1)", {
+        'post_diameter': 150,
+        'post_section_type': SectionType.CIRCULAR,
+        'post_material': PostMaterial.ALUMINIUM,
+        'post_steel_grade': 240  # 6061-T6 yield strength
+    }),
+    ('timber', "3. TIMBER - Square 150×150, C24", " (k_mod=0.9, γ_M=1.3)", {
+        'post_diameter': 150,
+        'post_section_type': SectionType.SQUARE,
+        'post_material': PostMaterial.TIMBER,
+        'post_steel_grade': 24  # C24 bending strength
+    }),
+]
 
-# Test 2: Aluminium CHS 150×8, 6061-T6
-print("\n2. ALUMINIUM - CHS 150×8, 6061-T6")
-inputs_alu = base_inputs.copy()
-inputs_alu.update({
-    'post_diameter': 150,
-    'post_section_type': 'circular',
-    'post_material': 'aluminium',
-    'post_steel_grade': 240  # 6061-T6 yield strength
-})
-results_alu = calc.calculate_wind_loading(inputs_alu)
-print(f"   Design resistance:   {results_alu['post_check']['sigma_Rd']:.1f} N/mm² (γ_M1 = 1.1)")
-print(f"   Bending stress:      {results_alu['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_alu['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_alu['post_check']['bending_status']}")
-
-# Test 3: Timber SHS 150×150, C24
-print("\n3. TIMBER - Square 150×150, C24")
-inputs_timber = base_inputs.copy()
-inputs_timber.update({
-    'post_diameter': 150,
-    'post_section_type': 'square',
-    'post_material': 'timber',
-    'post_steel_grade': 24  # C24 bending strength
-})
-results_timber = calc.calculate_wind_loading(inputs_timber)
-print(f"   Design resistance:   {results_timber['post_check']['sigma_Rd']:.1f} N/mm² (k_mod=0.9, γ_M=1.3)")
-print(f"   Bending stress:      {results_timber['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_timber['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_timber['post_check']['bending_status']}")
+results = {}
+for name, heading, note, overrides in cases:
+    post_check = calc.calculate_wind_loading({**base_inputs, **overrides})['post_check']
+    results[name] = post_check
+    print(f"\n{heading}")
+    print(f"   Design resistance:   {post_check['sigma_Rd']:.1f} N/mm²{note}")
+    print(f"   Bending stress:      {post_check['sigma_Ed']:.1f} N/mm²")
+    print(f"   Utilization:         {post_check['eta_bending']:.3f}")
+    print(f"   Status:              {post_check['bending_status']}")
 
 # Comparison
 print("\n" + "="*70)
 print("COMPARISON")
 print("="*70)
-print(f"Steel utilization:     {results_steel['post_check']['eta_bending']:.3f}")
-print(f"Aluminium utilization: {results_alu['post_check']['eta_bending']:.3f} ({results_alu['post_check']['eta_bending']/results_steel['post_check']['eta_bending']:.2f}x)")
-print(f"Timber utilization:    {results_timber['post_check']['eta_bending']:.3f} ({results_timber['post_check']['eta_bending']/results_steel['post_check']['eta_bending']:.2f}x)")
+eta_steel = results['steel']['eta_bending']
+eta_alu = results['aluminium']['eta_bending']
+eta_timber = results['timber']['eta_bending']
+print(f"Steel utilization:     {eta_steel:.3f}")
+print(f"Aluminium utilization: {eta_alu:.3f} ({eta_alu/eta_steel:.2f}x)")
+print(f"Timber utilization:    {eta_timber:.3f} ({eta_timber/eta_steel:.2f}x)")
 
 print("\nKEY INSIGHTS:")
 print("- Steel: Highest strength, lowest partial factor (γ_M0 = 1.0)")
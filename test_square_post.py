@@ -1,69 +1,55 @@
 """Test circular vs square post sections"""
 
-from post_mounted_calculator import PostMountedCalculator
+import sys
+from dataclasses import replace
+from post_mounted_calculator import PostMountedCalculator, SectionType
+from _fixtures import POST_BASE
 
 calc = PostMountedCalculator()
+lines = []
 
-# Test inputs
-base_inputs = {
-    'sign_width': 3.0,
-    'sign_height': 2.0,
-    'sign_depth': 0.3,
-    'sign_base_height': 2.5,
-    'post_height': 4.5,
-    'site_altitude': 50,
-    'v_map': 22.5,
-    'distance_to_shore': 20,
-    'terrain_type': 'country',
-    'post_diameter': 150,
-    'post_thickness': 8,
-    'post_steel_grade': 275,
-    'foundation_type': 'concrete',
-    'embedment_depth': 1.5
-}
-
-print("="*70)
-print("CIRCULAR vs SQUARE POST COMPARISON")
-print("="*70)
+lines.append("="*70)
+lines.append("CIRCULAR vs SQUARE POST COMPARISON")
+lines.append("="*70)
 
 # Test 1: Circular (CHS 150×8)
-inputs_chs = base_inputs.copy()
-inputs_chs['post_section_type'] = 'circular'
+inputs_chs = replace(POST_BASE, post_section_type=SectionType.CIRCULAR)
 results_chs = calc.calculate_wind_loading(inputs_chs)
 
-print("\n1. CIRCULAR HOLLOW SECTION (CHS 150×8)")
-print(f"   Wind force on post:  {results_chs['F_w_post']:.2f} kN (c_f = 0.7)")
-print(f"   Total wind force:    {results_chs['force_kN']:.2f} kN")
-print(f"   Overturning moment:  {results_chs['M_total']:.2f} kNm")
-print(f"   Post bending util:   {results_chs['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_chs['post_check']['bending_status']}")
+lines.append("\n1. CIRCULAR HOLLOW SECTION (CHS 150×8)")
+lines.append(f"   Wind force on post:  {results_chs['F_w_post']:.2f} kN (c_f = 0.7)")
+lines.append(f"   Total wind force:    {results_chs['force_kN']:.2f} kN")
+lines.append(f"   Overturning moment:  {results_chs['M_total']:.2f} kNm")
+lines.append(f"   Post bending util:   {results_chs['post_check']['eta_bending']:.3f}")
+lines.append(f"   Status:              {results_chs['post_check']['bending_status']}")
 
 # Test 2: Square (SHS 150×8)
-inputs_shs = base_inputs.copy()
-inputs_shs['post_section_type'] = 'square'
+inputs_shs = replace(POST_BASE, post_section_type=SectionType.SQUARE)
 results_shs = calc.calculate_wind_loading(inputs_shs)
 
-print("\n2. SQUARE HOLLOW SECTION (SHS 150×8)")
-print(f"   Wind force on post:  {results_shs['F_w_post']:.2f} kN (c_f = 2.0)")
-print(f"   Total wind force:    {results_shs['force_kN']:.2f} kN")
-print(f"   Overturning moment:  {results_shs['M_total']:.2f} kNm")
-print(f"   Post bending util:   {results_shs['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_shs['post_check']['bending_status']}")
+lines.append("\n2. SQUARE HOLLOW SECTION (SHS 150×8)")
+lines.append(f"   Wind force on post:  {results_shs['F_w_post']:.2f} kN (c_f = 2.0)")
+lines.append(f"   Total wind force:    {results_shs['force_kN']:.2f} kN")
+lines.append(f"   Overturning moment:  {results_shs['M_total']:.2f} kNm")
+lines.append(f"   Post bending util:   {results_shs['post_check']['eta_bending']:.3f}")
+lines.append(f"   Status:              {results_shs['post_check']['bending_status']}")
 
 # Comparison
-print("\n" + "="*70)
-print("COMPARISON")
-print("="*70)
+lines.append("\n" + "="*70)
+lines.append("COMPARISON")
+lines.append("="*70)
 force_increase = (results_shs['F_w_post'] / results_chs['F_w_post'] - 1) * 100
 moment_increase = (results_shs['M_total'] / results_chs['M_total'] - 1) * 100
 util_ratio = results_shs['post_check']['eta_bending'] / results_chs['post_check']['eta_bending']
 
-print(f"Post wind force increase (square vs circular): +{force_increase:.1f}%")
-print(f"Total moment increase:                         +{moment_increase:.1f}%")
-print(f"Utilization ratio (SHS/CHS):                   {util_ratio:.2f}x")
+lines.append(f"Post wind force increase (square vs circular): +{force_increase:.1f}%")
+lines.append(f"Total moment increase:                         +{moment_increase:.1f}%")
+lines.append(f"Utilization ratio (SHS/CHS):                   {util_ratio:.2f}x")
+
+lines.append("\nKEY INSIGHTS:")
+lines.append("- Square posts experience ~2.9x more wind force on the post itself")
+lines.append("- BUT square sections have ~27% higher bending stiffness")
+lines.append("- Net effect: Square post utilization is ~2.3x higher than circular")
+lines.append("\n✓ Both section types now supported!")
 
-print("\nKEY INSIGHTS:")
-print("- Square posts experience ~2.9x more wind force on the post itself")
-print("- BUT square sections have ~27% higher bending stiffness")
-print("- Net effect: Square post utilization is ~2.3x higher than circular")
-print("\n✓ Both section types now supported!")
+sys.stdout.write("\n".join(lines) + "\n")
@@ -1,89 +1,78 @@
 """Test solid timber posts (circular and square)"""
 
-from post_mounted_calculator import PostMountedCalculator
+import sys
+from dataclasses import replace
+from post_mounted_calculator import PostMountedCalculator, SectionType
+from _fixtures import TIMBER_BASE
 
 calc = PostMountedCalculator()
+lines = []
 
-# Base inputs
-base_inputs = {
-    'sign_width': 3.0,
-    'sign_height': 2.0,
-    'sign_depth': 0.3,
-    'sign_base_height': 2.5,
-    'post_height': 4.5,
-    'site_altitude': 50,
-    'v_map': 22.5,
-    'distance_to_shore': 20,
-    'terrain_type': 'country',
-    'post_material': 'timber',
-    'post_steel_grade': 24,  # C24 bending strength
-    'foundation_type': 'concrete',
-    'embedment_depth': 1.5
-}
-
-print("="*70)
-print("SOLID TIMBER POST COMPARISON")
-print("="*70)
+lines.append("="*70)
+lines.append("SOLID TIMBER POST COMPARISON")
+lines.append("="*70)
 
 # Test 1: Circular solid timber 200mm diameter
-print("\n1. SOLID CIRCULAR TIMBER - Ø200mm, C24")
-inputs_circ = base_inputs.copy()
-inputs_circ.update({
-    'post_diameter': 200,
-    'post_thickness': 0,  # Not used for solid sections
-    'post_section_type': 'circular'
-})
+lines.append("\n1. SOLID CIRCULAR TIMBER - Ø200mm, C24")
+inputs_circ = replace(
+    TIMBER_BASE,
+    post_diameter=200,
+    post_thickness=0,  # Not used for solid sections
+    post_section_type=SectionType.CIRCULAR
+)
 results_circ = calc.calculate_wind_loading(inputs_circ)
-print(f"   Section modulus:     {results_circ['post_check']['W_el']/1000:.1f} cm³")
-print(f"   Design resistance:   {results_circ['post_check']['sigma_Rd']:.1f} N/mm²")
-print(f"   Bending stress:      {results_circ['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_circ['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_circ['post_check']['bending_status']}")
+lines.append(f"   Section modulus:     {results_circ['post_check']['W_el']/1000:.1f} cm³")
+lines.append(f"   Design resistance:   {results_circ['post_check']['sigma_Rd']:.1f} N/mm²")
+lines.append(f"   Bending stress:      {results_circ['post_check']['sigma_Ed']:.1f} N/mm²")
+lines.append(f"   Utilization:         {results_circ['post_check']['eta_bending']:.3f}")
+lines.append(f"   Status:              {results_circ['post_check']['bending_status']}")
 
 # Test 2: Square solid timber 200×200mm
-print("\n2. SOLID SQUARE TIMBER - 200×200mm, C24")
-inputs_square = base_inputs.copy()
-inputs_square.update({
-    'post_diameter': 200,
-    'post_thickness': 0,  # Not used for solid sections
-    'post_section_type': 'square'
-})
+lines.append("\n2. SOLID SQUARE TIMBER - 200×200mm, C24")
+inputs_square = replace(
+    TIMBER_BASE,
+    post_diameter=200,
+    post_thickness=0,  # Not used for solid sections
+    post_section_type=SectionType.SQUARE
+)
 results_square = calc.calculate_wind_loading(inputs_square)
-print(f"   Section modulus:     {results_square['post_check']['W_el']/1000:.1f} cm³")
-print(f"   Design resistance:   {results_square['post_check']['sigma_Rd']:.1f} N/mm²")
-print(f"   Bending stress:      {results_square['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_square['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_square['post_check']['bending_status']}")
+lines.append(f"   Section modulus:     {results_square['post_check']['W_el']/1000:.1f} cm³")
+lines.append(f"   Design resistance:   {results_square['post_check']['sigma_Rd']:.1f} N/mm²")
+lines.append(f"   Bending stress:      {results_square['post_check']['sigma_Ed']:.1f} N/mm²")
+lines.append(f"   Utilization:         {results_square['post_check']['eta_bending']:.3f}")
+lines.append(f"   Status:              {results_square['post_check']['bending_status']}")
 
 # Test 3: Smaller circular timber 150mm diameter
-print("\n3. SOLID CIRCULAR TIMBER - Ø150mm, C24")
-inputs_small = base_inputs.copy()
-inputs_small.update({
-    'post_diameter': 150,
-    'post_thickness': 0,
-    'post_section_type': 'circular'
-})
+lines.append("\n3. SOLID CIRCULAR TIMBER - Ø150mm, C24")
+inputs_small = replace(
+    TIMBER_BASE,
+    post_diameter=150,
+    post_thickness=0,
+    post_section_type=SectionType.CIRCULAR
+)
 results_small = calc.calculate_wind_loading(inputs_small)
-print(f"   Section modulus:     {results_small['post_check']['W_el']/1000:.1f} cm³")
-print(f"   Design resistance:   {results_small['post_check']['sigma_Rd']:.1f} N/mm²")
-print(f"   Bending stress:      {results_small['post_check']['sigma_Ed']:.1f} N/mm²")
-print(f"   Utilization:         {results_small['post_check']['eta_bending']:.3f}")
-print(f"   Status:              {results_small['post_check']['bending_status']}")
+lines.append(f"   Section modulus:     {results_small['post_check']['W_el']/1000:.1f} cm³")
+lines.append(f"   Design resistance:   {results_small['post_check']['sigma_Rd']:.1f} N/mm²")
+lines.append(f"   Bending stress:      {results_small['post_check']['sigma_Ed']:.1f} N/mm²")
+lines.append(f"   Utilization:         {results_small['post_check']['eta_bending']:.3f}")
+lines.append(f"   Status:              {results_small['post_check']['bending_status']}")
 
 # Comparison
-print("\n" + "="*70)
-print("COMPARISON")
-print("="*70)
-print(f"Circular Ø200:  W_el = {results_circ['post_check']['W_el']/1000:.1f} cm³, η = {results_circ['post_check']['eta_bending']:.3f}")
-print(f"Square 200×200: W_el = {results_square['post_check']['W_el']/1000:.1f} cm³, η = {results_square['post_check']['eta_bending']:.3f}")
-print(f"Circular Ø150:  W_el = {results_small['post_check']['W_el']/1000:.1f} cm³, η = {results_small['post_check']['eta_bending']:.3f}")
+lines.append("\n" + "="*70)
+lines.append("COMPARISON")
+lines.append("="*70)
+lines.append(f"Circular Ø200:  W_el = {results_circ['post_check']['W_el']/1000:.1f} cm³, η = {results_circ['post_check']['eta_bending']:.3f}")
+lines.append(f"Square 200×200: W_el = {results_square['post_check']['W_el']/1000:.1f} cm³, η = {results_square['post_check']['eta_bending']:.3f}")
+lines.append(f"Circular Ø150:  W_el = {results_small['post_check']['W_el']/1000:.1f} cm³, η = {results_small['post_check']['eta_bending']:.3f}")
 
 section_ratio = results_square['post_check']['W_el'] / results_circ['post_check']['W_el']
-print(f"\nSquare vs Circular (same size): {section_ratio:.2f}x section modulus")
+lines.append(f"\nSquare vs Circular (same size): {section_ratio:.2f}x section modulus")
+
+lines.append("\nKEY INSIGHTS:")
+lines.append("- Square sections have ~27% more section modulus than circular (same size)")
+lines.append("- Solid timber sections are much stiffer than hollow steel/aluminium")
+lines.append("- Timber Ø200 or 200×200 both work for this loading")
+lines.append("- Timber Ø150 is marginal/fails - need larger section")
+lines.append("\n✓ Solid timber sections (circular & square) now supported!")
 
-print("\nKEY INSIGHTS:")
-print("- Square sections have ~27% more section modulus than circular (same size)")
-print("- Solid timber sections are much stiffer than hollow steel/aluminium")
-print("- Timber Ø200 or 200×200 both work for this loading")
-print("- Timber Ø150 is marginal/fails - need larger section")
-print("\n✓ Solid timber sections (circular & square) now supported!")
+sys.stdout.write("\n".join(lines) + "\n")
@@ -3,12 +3,37 @@ Test suite for BS EN 1991-1-4 Wind Loading Calculator
 Validates against SCI P394 Sheffield Bioincubator worked example (Section 9.1, pages 63-73)
 """
 
+import operator
+import sys
+from unittest import mock
 import pytest
 import numpy as np
-from wind_calculator import WindLoadCalculator
+from wind_calculator import TerrainType, WindInputs, WindLoadCalculator, _wind_stages
+from _fixtures import get_wind_calculator
 
 
-def test_sheffield_bioincubator():
+# Sheffield Bioincubator (P394 Section 9.1, E-W direction): stage, result key,
+# expected value and absolute tolerance
+#   Stage 1   v_map        22.1 m/s
+#   Stage 2   c_alt        1.1
+#   Stage 4   c_dir        1.0 (worst case)
+#   Stage 7   c_e * c_e,T  ≈ 2.9 (depends on interpretation)
+#   Stage 11  q_p          1058 Pa (5%)
+#   Stage 18  c_s          0.85
+#   Stage 19  c_d          1.03
+#   Stage 21  c_f          0.92
+#   Stage 24  F_w          460 kN (8%, accounts for compounding factors)
+_KEYS = np.array(['v_map', 'c_alt', 'c_dir', 'c_e_eff', 'q_p', 'c_s', 'c_d', 'c_f', 'force_kN'])
+_EXPECTED = np.array([22.1, 1.1, 1.0, 2.9, 1058.0, 0.85, 1.03, 0.92, 460.0])
+_TOL = np.array([0.1, 0.02, 0.0, 0.2, 1058.0 * 0.05, 0.05, 0.05, 0.05, 460.0 * 0.08])
+
+@pytest.fixture(scope='session')
+def calc():
+    """One calculator shared by every test in the session"""
+    return get_wind_calculator()
+
+
+def test_sheffield_bioincubator(calc):
     """
     Validate against P394 worked example (pages 63-73)
     
@@ -31,8 +56,6 @@ def test_sheffield_bioincubator():
     - F_w = 460 kN (E-W direction)
     """
     
-    calculator = WindLoadCalculator()
-    
     # Input data for Sheffield Bioincubator (E-W direction)
     inputs = {
         'sign_width': 20,  # m (E-W breadth, cross-wind)
@@ -47,162 +70,102 @@ def test_sheffield_bioincubator():
         'mounting_type': 'wall_mounted_fascia'
     }
     
-    results = calculator.calculate_wind_loading(inputs)
-    
-    # Validation with 2% tolerance
-    print("\n" + "="*60)
-    print("Sheffield Bioincubator Validation Test")
-    print("="*60)
-    
-    # Stage 1: Fundamental wind speed
-    assert abs(results['v_map'] - 22.1) < 0.1
-    print(f"✓ v_map: {results['v_map']:.1f} m/s (Expected: 22.1 m/s)")
-    
-    # Stage 2: Altitude factor
-    expected_c_alt = 1.1
-    assert abs(results['c_alt'] - expected_c_alt) < 0.02
-    print(f"✓ c_alt: {results['c_alt']:.2f} (Expected: {expected_c_alt})")
-    
-    # Stage 4: Directional factor
-    assert results['c_dir'] == 1.0
-    print(f"✓ c_dir: {results['c_dir']:.2f} (Expected: 1.0)")
-    
-    # Stage 7: Exposure factor (approximate, depends on interpretation)
-    # P394 shows effective c_e * c_e,T ≈ 2.9 for this case
-    # We calculate c_e and c_e,T separately
-    effective_c_e = results['c_e'] * results['c_e_T']
-    expected_effective = 2.9
-    assert abs(effective_c_e - expected_effective) < 0.2  # Allow some variation
-    print(f"✓ c_e: {results['c_e']:.2f}, c_e,T: {results['c_e_T']:.2f}, effective: {effective_c_e:.2f} (Expected: ~{expected_effective})")
-    
-    # Stage 11: Peak velocity pressure
-    expected_q_p = 1058  # Pa
-    tolerance_q_p = expected_q_p * 0.05  # 5% tolerance
-    assert abs(results['q_p'] - expected_q_p) < tolerance_q_p
-    print(f"✓ q_p: {results['q_p']:.0f} Pa (Expected: {expected_q_p} Pa)")
-    
-    # Stage 18: Size factor
-    expected_c_s = 0.85
-    assert abs(results['c_s'] - expected_c_s) < 0.05  # Allow 5% variation
-    print(f"✓ c_s: {results['c_s']:.2f} (Expected: {expected_c_s})")
-    
-    # Stage 19: Dynamic factor
-    expected_c_d = 1.03
-    assert abs(results['c_d'] - expected_c_d) < 0.05  # Allow 5% variation
-    print(f"✓ c_d: {results['c_d']:.2f} (Expected: {expected_c_d})")
-    
-    # Stage 21: Force coefficient
-    expected_c_f = 0.92
-    assert abs(results['c_f'] - expected_c_f) < 0.05
-    print(f"✓ c_f: {results['c_f']:.2f} (Expected: {expected_c_f})")
-    
-    # Stage 24: Wind force
-    expected_force_kN = 460  # kN
-    tolerance_force = expected_force_kN * 0.08  # 8% tolerance (accounts for compounding factors)
-    assert abs(results['force_kN'] - expected_force_kN) < tolerance_force
-    print(f"✓ F_w: {results['force_kN']:.1f} kN (Expected: {expected_force_kN} kN)")
-    
-    print("="*60)
-    print("✓ Sheffield Bioincubator validation PASSED")
-    print(f"  All values within acceptable tolerance")
-    print("="*60)
-    
-    return results
+    results = calc.calculate_wind_loading(inputs)
+    
+    # P394 shows effective c_e * c_e,T ≈ 2.9 for this case; we calculate
+    # c_e and c_e,T separately
+    checks = dict(results, c_e_eff=results['c_e'] * results['c_e_T'])
+    actual = np.fromiter((checks[k] for k in _KEYS), dtype=np.float64, count=len(_KEYS))
+    diff = np.abs(actual - _EXPECTED)
+    bad = np.flatnonzero(diff > _TOL)
+    assert bad.size == 0, (
+        f"Outside tolerance: {dict(zip(_KEYS[bad], actual[bad]))}"
+    )
+    
+    lines = []
+    lines.append("\n" + "="*60)
+    lines.append("Sheffield Bioincubator Validation Test")
+    lines.append("="*60)
+    lines.append(f"✓ v_map: {results['v_map']:.1f} m/s (Expected: 22.1 m/s)")
+    lines.append(f"✓ c_alt: {results['c_alt']:.2f} (Expected: 1.1)")
+    lines.append(f"✓ c_dir: {results['c_dir']:.2f} (Expected: 1.0)")
+    lines.append(f"✓ c_e: {results['c_e']:.2f}, c_e,T: {results['c_e_T']:.2f}, effective: {checks['c_e_eff']:.2f} (Expected: ~2.9)")
+    lines.append(f"✓ q_p: {results['q_p']:.0f} Pa (Expected: 1058 Pa)")
+    lines.append(f"✓ c_s: {results['c_s']:.2f} (Expected: 0.85)")
+    lines.append(f"✓ c_d: {results['c_d']:.2f} (Expected: 1.03)")
+    lines.append(f"✓ c_f: {results['c_f']:.2f} (Expected: 0.92)")
+    lines.append(f"✓ F_w: {results['force_kN']:.1f} kN (Expected: 460 kN)")
+    
+    lines.append("="*60)
+    lines.append("✓ Sheffield Bioincubator validation PASSED")
+    lines.append(f"  All values within acceptable tolerance")
+    lines.append("="*60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def test_altitude_factor():
-    """Test altitude factor calculation"""
-    calculator = WindLoadCalculator()
-    
-    # Test case 1: Low building (< 16.7m), sea level
-    c_alt = calculator.calculate_altitude_factor(0, 10)
-    assert c_alt == 1.0
-    
-    # Test case 2: Low building, 100m altitude
-    c_alt = calculator.calculate_altitude_factor(100, 10)
-    assert abs(c_alt - 1.1) < 0.01
-    
-    # Test case 3: Tall building, 100m altitude
-    c_alt = calculator.calculate_altitude_factor(100, 30)
-    assert c_alt > 1.0 and c_alt < 1.1
-    
-    print("✓ Altitude factor tests passed")
+# (calculator method, arguments, conditions the result must satisfy)
+HELPER_CASES = [
+    # Altitude factor
+    pytest.param('calculate_altitude_factor', (0, 10), [(operator.eq, 1.0)],
+                 id='altitude-low-building-sea-level'),
+    pytest.param('calculate_altitude_factor', (100, 10), [(operator.gt, 1.09), (operator.lt, 1.11)],
+                 id='altitude-low-building-100m'),
+    pytest.param('calculate_altitude_factor', (100, 30), [(operator.gt, 1.0), (operator.lt, 1.1)],
+                 id='altitude-tall-building-100m'),
+    # Size factor
+    pytest.param('calculate_size_factor', (2, 3, 10, 'B'), [(operator.eq, 1.0)],
+                 id='size-small-sign'),  # b+h = 5m
+    pytest.param('calculate_size_factor', (150, 150, 10, 'B'), [(operator.lt, 1.0)],
+                 id='size-large-sign'),  # Should have reduction
+    # Dynamic factor
+    pytest.param('calculate_dynamic_factor', (10, 5), [(operator.eq, 1.0)],
+                 id='dynamic-low-building'),
+    pytest.param('calculate_dynamic_factor', (30, 10), [(operator.gt, 1.0)],
+                 id='dynamic-tall-slender'),
+    # Force coefficient
+    pytest.param('calculate_force_coefficient', (10, 10), [(operator.gt, 0.9), (operator.lt, 1.0)],
+                 id='force-coefficient-square'),  # h/d = 1
+    pytest.param('calculate_force_coefficient', (15, 5), [(operator.gt, 1.0)],
+                 id='force-coefficient-slender'),  # h/d = 3
+    pytest.param('calculate_force_coefficient', (5, 10), [(operator.lt, 1.0)],
+                 id='force-coefficient-flat'),  # h/d = 0.5
+]
 
+# (height, displacement, distance to shore, terrain, expected zone, c_e bounds)
+EXPOSURE_CASES = [
+    pytest.param(10, 0, 0, 'sea', 'A', (2.3, np.inf),
+                 id='zone-A-sea'),  # Should be higher for sea
+    pytest.param(10, 0, 50, TerrainType.COUNTRY, 'B', (1.8, 2.5),
+                 id='zone-B-country'),  # Broader range for interpolated values
+    pytest.param(10, 0, 100, 'town', 'C', (2.0, np.inf),
+                 id='zone-C-town'),  # Town uses base exposure, correction applied via c_e,T
+]
 
-def test_exposure_factor():
-    """Test exposure factor calculation"""
-    calculator = WindLoadCalculator()
-    
-    # Test Zone A (sea)
-    c_e, zone = calculator.calculate_exposure_factor(10, 0, 0, 'sea')
-    assert zone == 'A'
-    assert c_e > 2.3  # Should be higher for sea
-    
-    # Test Zone B (country)
-    c_e, zone = calculator.calculate_exposure_factor(10, 0, 50, 'country')
-    assert zone == 'B'
-    assert 1.8 < c_e < 2.5  # Broader range for interpolated values
-    
-    # Test Zone C (town)
-    c_e, zone = calculator.calculate_exposure_factor(10, 0, 100, 'town')
-    assert zone == 'C'
-    assert c_e > 2.0  # Town uses base exposure, correction applied via c_e,T
-    
-    print("✓ Exposure factor tests passed")
+# Postcodes with the regional v_map bounds (m/s) they must fall within
+_POSTCODES = ['AB10 1AB', 'B1 1AA', 'TR1 1AA']  # Scottish, Midlands, coastal
+_VMAP_MIN = np.array([23.0, -np.inf, 23.0])  # high wind, -, high wind
+_VMAP_MAX = np.array([np.inf, 22.0, np.inf])  # -, lower wind, -
 
 
-def test_size_factor():
-    """Test size factor calculation"""
-    calculator = WindLoadCalculator()
-    
-    # Small sign
-    c_s = calculator.calculate_size_factor(2, 3, 10, 'B')
-    assert c_s == 1.0  # b+h = 5m
-    
-    # Large sign
-    c_s = calculator.calculate_size_factor(150, 150, 10, 'B')
-    assert c_s < 1.0  # Should have reduction
-    
-    print("✓ Size factor tests passed")
-
-
-def test_dynamic_factor():
-    """Test dynamic factor calculation"""
-    calculator = WindLoadCalculator()
-    
-    # Low building
-    c_d = calculator.calculate_dynamic_factor(10, 5)
-    assert c_d == 1.0
-    
-    # Tall slender building
-    c_d = calculator.calculate_dynamic_factor(30, 10)
-    assert c_d > 1.0
-    
-    print("✓ Dynamic factor tests passed")
+@pytest.mark.parametrize('method, args, conditions', HELPER_CASES)
+def test_factor(calc, method, args, conditions):
+    """Individual factor calculations fall in the expected range"""
+    value = getattr(calc, method)(*args)
+    for op, bound in conditions:
+        assert op(value, bound), f"{method}{args} = {value}, expected {op.__name__} {bound}"
 
 
-def test_force_coefficient():
-    """Test force coefficient calculation"""
-    calculator = WindLoadCalculator()
-    
-    # Square cross-section (h/d = 1)
-    c_f = calculator.calculate_force_coefficient(10, 10)
-    assert 0.9 < c_f < 1.0
-    
-    # Tall slender (h/d = 3)
-    c_f = calculator.calculate_force_coefficient(15, 5)
-    assert c_f > 1.0
-    
-    # Flat (h/d = 0.5)
-    c_f = calculator.calculate_force_coefficient(5, 10)
-    assert c_f < 1.0
-    
-    print("✓ Force coefficient tests passed")
+@pytest.mark.parametrize('height, displacement, distance, terrain, expected_zone, bounds',
+                         EXPOSURE_CASES)
+def test_exposure_factor(calc, height, displacement, distance, terrain, expected_zone, bounds):
+    """Exposure factor picks the right zone and a plausible c_e"""
+    c_e, zone = calc.calculate_exposure_factor(height, displacement, distance, terrain)
+    assert zone == expected_zone
+    assert bounds[0] < c_e < bounds[1]
 
 
-def test_typical_signage():
+def test_typical_signage(calc):
     """Test typical signage scenarios"""
-    calculator = WindLoadCalculator()
     
     # Test case 1: Small wall-mounted fascia sign
     inputs = {
@@ -213,21 +176,21 @@ def test_typical_signage():
         'site_altitude': 50,
         'v_map': 22.0,
         'distance_to_shore': 50,
-        'terrain_type': 'country',
+        'terrain_type': TerrainType.COUNTRY,
         'distance_into_town': 0,
         'mounting_type': 'wall_mounted_fascia'
     }
     
-    results = calculator.calculate_wind_loading(inputs)
+    results = calc.calculate_wind_loading(inputs)
     
     assert results['force_kN'] > 0
     assert results['q_p'] > 0
     assert results['moment_kNm'] > 0
     
-    print(f"\n✓ Small fascia sign test:")
-    print(f"  Wind force: {results['force_kN']:.2f} kN")
-    print(f"  Peak pressure: {results['q_p']:.0f} Pa")
-    print(f"  Overturning moment: {results['moment_kNm']:.2f} kNm")
+    lines = [f"\n✓ Small fascia sign test:"]
+    lines.append(f"  Wind force: {results['force_kN']:.2f} kN")
+    lines.append(f"  Peak pressure: {results['q_p']:.0f} Pa")
+    lines.append(f"  Overturning moment: {results['moment_kNm']:.2f} kNm")
     
     # Test case 2: Large high-level sign
     inputs2 = {
@@ -238,59 +201,143 @@ def test_typical_signage():
         'site_altitude': 20,
         'v_map': 23.0,
         'distance_to_shore': 10,
-        'terrain_type': 'country',
+        'terrain_type': TerrainType.COUNTRY,
         'distance_into_town': 0,
         'mounting_type': 'wall_mounted_fascia'
     }
     
-    results2 = calculator.calculate_wind_loading(inputs2)
+    results2 = calc.calculate_wind_loading(inputs2)
     
     assert results2['force_kN'] > results['force_kN']  # Should be higher
     
-    print(f"\n✓ Large high-level sign test:")
-    print(f"  Wind force: {results2['force_kN']:.2f} kN")
-    print(f"  Peak pressure: {results2['q_p']:.0f} Pa")
-    print(f"  Overturning moment: {results2['moment_kNm']:.2f} kNm")
+    lines.append(f"\n✓ Large high-level sign test:")
+    lines.append(f"  Wind force: {results2['force_kN']:.2f} kN")
+    lines.append(f"  Peak pressure: {results2['q_p']:.0f} Pa")
+    lines.append(f"  Overturning moment: {results2['moment_kNm']:.2f} kNm")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def test_postcode_lookup():
-    """Test postcode wind speed lookup"""
-    calculator = WindLoadCalculator()
-    
-    # Test Scottish postcode (high wind)
-    v_map = calculator.lookup_wind_speed('AB10 1AB')
-    assert v_map >= 23.0
-    
-    # Test Midlands postcode (lower wind)
-    v_map = calculator.lookup_wind_speed('B1 1AA')
-    assert v_map <= 22.0
+def test_postcode_lookup(calc):
+    """Postcode wind speed lookup returns the regional v_map"""
+    v_map = calc.lookup_wind_speed_bulk(_POSTCODES)
+    ok = (v_map >= _VMAP_MIN) & (v_map <= _VMAP_MAX)
+    assert ok.all(), f"Outside regional range: {dict(zip(np.array(_POSTCODES)[~ok], v_map[~ok]))}"
     
-    # Test coastal postcode (high wind)
-    v_map = calculator.lookup_wind_speed('TR1 1AA')
-    assert v_map >= 23.0
-    
-    print("✓ Postcode lookup tests passed")
+    assert v_map.tolist() == [calc.lookup_wind_speed(code) for code in _POSTCODES]
+
+
+# Signs covering all three zones, coastal interpolation, town correction,
+# c_d > 1, h/d > 5 and the postcode fallback
+_BATCH_INPUTS = {
+    'sign_width': np.array([20.0, 3.0, 8.0, 2.0, 1.0]),
+    'sign_height': np.array([27.0, 1.5, 3.0, 1.0, 6.0]),
+    'sign_depth': np.array([29.0, 0.3, 0.5, 0.1, 0.5]),
+    'building_height': np.array([27.0, 6.0, 15.0, 4.0, 40.0]),
+    'site_altitude': np.array([105.0, 50.0, 20.0, 0.0, 250.0]),
+    'v_map': np.array([22.1, 22.0, 23.0, 0.0, 0.0]),
+    'postcode': ['', '', '', 'TR1 1AA', 'XX1 1AA'],
+    'distance_to_shore': [100, 50, 10, 0.05, '100+'],
+    'terrain_type': ['town', 'country', 'country', 'sea', 'town'],
+    'distance_into_town': np.array([2.0, 0.0, 0.0, 0.0, 5.0]),
+}
+
+
+def test_batch_matches_scalar(calc):
+    """calculate_wind_loading_batch reproduces the per-sign calculation"""
+    batch = calc.calculate_wind_loading_batch(_BATCH_INPUTS)
+    
+    for i in range(len(_BATCH_INPUTS['sign_width'])):
+        row = {k: v[i] for k, v in _BATCH_INPUTS.items()}
+        results = calc.calculate_wind_loading(row)
+        assert batch['zone'][i] == results['zone']
+        assert batch['warning_flags'][i] == results['warning_flags']
+        for key in ('v_map', 'c_alt', 'c_e', 'c_e_T', 'q_p', 'c_s', 'c_d', 'c_f',
+                    'force_kN', 'moment_kNm'):
+            assert batch[key][i] == pytest.approx(results[key], rel=1e-12), key
+
+
+
+def test_batch_records_match_dict(calc):
+    """records=True packs the same batch into float32 fields"""
+    batch = calc.calculate_wind_loading_batch(_BATCH_INPUTS)
+    records = calc.calculate_wind_loading_batch(_BATCH_INPUTS, records=True)
+    
+    assert calc.warnings == batch['warnings']
+    for key in records.dtype.names:
+        if records.dtype[key].kind == 'f':
+            np.testing.assert_allclose(records[key], batch[key], rtol=1e-6, err_msg=key)
+        else:
+            np.testing.assert_array_equal(records[key], batch[key], err_msg=key)
+
+
+def test_repeat_call_reuses_stages(calc):
+    """A repeated sign is served from the stage cache with fresh warnings"""
+    row = {k: v[4] for k, v in _BATCH_INPUTS.items()}
+    first = calc.calculate_wind_loading(row)
+    hits = _wind_stages.cache_info().hits
+    second = calc.calculate_wind_loading(row)
+    
+    assert _wind_stages.cache_info().hits == hits + 1
+    assert second.to_dict() == first.to_dict()
+    assert second['warnings'] is not first['warnings']
+
+
+def test_subclass_stage_override_applies():
+    """Overriding a stage method bypasses the stage cache"""
+    class Overridden(WindLoadCalculator):
+        def calculate_altitude_factor(self, altitude, height):
+            return 99.0
+    
+    row = {k: v[4] for k, v in _BATCH_INPUTS.items()}
+    assert Overridden().calculate_wind_loading(row)['c_alt'] == 99.0
+    assert WindLoadCalculator().calculate_wind_loading(row)['c_alt'] != 99.0
+    
+    calc = WindLoadCalculator()
+    with mock.patch.object(WindLoadCalculator, 'calculate_altitude_factor', return_value=99.0):
+        assert calc.calculate_wind_loading(row)['c_alt'] == 99.0
+    calc.calculate_altitude_factor = lambda altitude, height: 98.0
+    assert calc.calculate_wind_loading(row)['c_alt'] == 98.0
+
+
+def test_second_call_keeps_first_warnings():
+    """A later calculation leaves an earlier result's warnings alone"""
+    class Overridden(WindLoadCalculator):
+        def calculate_altitude_factor(self, altitude, height):
+            return super().calculate_altitude_factor(altitude, height)
+    
+    row = {k: v[4] for k, v in _BATCH_INPUTS.items()}
+    row['sign_depth'] = row['sign_height'] / 12  # h/d = 12
+    for calc in (WindLoadCalculator(), Overridden()):
+        first = calc.calculate_wind_loading(row)
+        warnings = list(first['warnings'])
+        second = calc.calculate_wind_loading(row)
+        
+        assert first['warnings'] == warnings
+        assert second['warnings'] == warnings
+        assert sum('h/d' in w for w in warnings) == 1
+
+
+
+def test_result_mapping_matches_to_dict(calc):
+    """The result's Mapping view has the same keys and values as to_dict()"""
+    row = {k: v[4] for k, v in _BATCH_INPUTS.items()}
+    results = calc.calculate_wind_loading(row)
+    
+    assert results['stage_1_ref'] == 'P394 Section 5.1, page 19'
+    assert list(results) == list(results.to_dict())
+    assert dict(results) == results.to_dict()
+
+
+def test_dataclass_inputs_match_dict(calc):
+    """WindInputs and the equivalent input dictionary give the same results"""
+    row = {k: v[4] for k, v in _BATCH_INPUTS.items()}
+    inputs = WindInputs.from_dict(row)
+    
+    assert inputs.terrain_type is TerrainType.TOWN
+    assert calc.calculate_wind_loading(inputs).to_dict() == calc.calculate_wind_loading(row).to_dict()
+    with pytest.raises(KeyError):
+        WindInputs.from_dict({k: v for k, v in row.items() if k != 'sign_depth'})
 
 
 if __name__ == '__main__':
-    print("\nRunning Wind Loading Calculator Test Suite")
-    print("="*60)
-    
-    # Run all tests
-    test_altitude_factor()
-    test_exposure_factor()
-    test_size_factor()
-    test_dynamic_factor()
-    test_force_coefficient()
-    test_postcode_lookup()
-    test_typical_signage()
-    
-    # Main validation test
-    print("\n" + "="*60)
-    print("Running Sheffield Bioincubator Validation")
-    print("="*60)
-    test_sheffield_bioincubator()
-    
-    print("\n" + "="*60)
-    print("ALL TESTS PASSED ✓")
-    print("="*60)
+    sys.exit(pytest.main([__file__, '-v', '-s']))
@@ -1,34 +1,100 @@
-import math
+"""
+Sheffield Bioincubator c_f / F_w check (P394 Section 9.1)
+
+Runs the original log₁₀ force coefficient formula and the corrected
+natural-log one side by side; --variant picks a single formula.
+"""
+
+import argparse
+import numpy as np
+
+# name: (a, b, log function, log label, description) for c_f = a + b·log(h/d)
+VARIANTS = {
+    'log10': (1.2, 0.2, np.log10, 'log₁₀', 'original formula'),
+    'ln': (0.935, 0.1839, np.log, 'ln', 'corrected formula'),
+}
 
 # Sheffield Bioincubator values
 h = 27  # height
 d = 29  # depth
 b = 20  # width
 
-# Calculate h/d
-h_d = h / d
-print(f"h/d = {h}/{d} = {h_d:.4f}")
-
-# Calculate c_f
-c_f = 1.2 + 0.2 * math.log10(h_d)
-print(f"c_f = 1.2 + 0.2 × log₁₀({h_d:.4f}) = {c_f:.4f}")
-print(f"Expected: 0.92")
-print(f"Match: {'✓' if abs(c_f - 0.92) < 0.01 else '✗'}")
-
-# Calculate A_ref
-A_ref = b * h
-print(f"\nA_ref = {b} × {h} = {A_ref} m²")
-
-# Calculate F_w (using values from your screenshot)
+# Values from the calculator screenshot
 q_p = 1056.22  # Pa
 c_s = 0.89
 c_d = 1.07
-c_f_calc = c_f
-A_ref_calc = A_ref
-
-F_w = q_p * c_s * c_d * c_f_calc * A_ref_calc / 1000
-print(f"\nF_w = {q_p} × {c_s} × {c_d} × {c_f_calc:.4f} × {A_ref_calc} / 1000")
-print(f"F_w = {F_w:.2f} kN")
-print(f"Expected: 460 kN")
-print(f"Difference: {abs(F_w - 460):.2f} kN ({abs(F_w - 460)/460*100:.1f}%)")
-print(f"Status: {'PASS' if abs(F_w - 460)/460*100 < 10 else 'CHECK'}")
+
+
+def _fw(h, d, b, q_p, c_s, c_d, variant='log10'):
+    """
+    Force coefficient and wind force for a rectangular sign or building
+
+    c_f = a + b·log(h/d) for the chosen variant, F_w = q_p·c_s·c_d·c_f·(b·h)/1000.
+    Takes scalars or broadcastable arrays, so a parametric sweep is one call.
+
+    Returns:
+        (c_f, F_w) with F_w in kN
+    """
+    a, k, log, _, _ = VARIANTS[variant]
+    c_f = a + k * log(np.divide(h, d))
+    F_w = q_p * c_s * c_d * c_f * np.multiply(b, h) / 1000.0
+    return c_f, F_w
+
+
+def compute_Fw(h, d, b, q_p, c_s, c_d) -> np.ndarray:
+    """
+    Wind force (kN) with the corrected natural-log c_f formula
+
+    Scalars or broadcastable arrays, e.g. h[:, None] against d[None, :]
+    for an h × d design grid.
+    """
+    return _fw(h, d, b, q_p, c_s, c_d, 'ln')[1]
+
+
+def check(variant: str) -> bool:
+    """Print the Sheffield check for one c_f formula; True if it passes"""
+    a, k, _, log_label, description = VARIANTS[variant]
+    h_d = h / d
+    c_f, F_w = _fw(h, d, b, q_p, c_s, c_d, variant)
+    A_ref = b * h
+    diff_pct = abs(F_w - 460)/460*100
+    passed = abs(c_f - 0.92) < 0.01 and diff_pct < 10
+
+    lines = [
+        f"[{variant}] {description}",
+        f"h/d = {h}/{d} = {h_d:.4f}",
+        f"c_f = {a} + {k} × {log_label}({h_d:.4f}) = {c_f:.4f}",
+        f"Expected: 0.92",
+        f"Match: {'✓ PASS' if abs(c_f - 0.92) < 0.01 else '✗ CHECK'}",
+        f"\nA_ref = {b} × {h} = {A_ref} m²",
+        f"\nF_w = {q_p} × {c_s} × {c_d} × {c_f:.4f} × {A_ref} / 1000",
+        f"F_w = {F_w:.2f} kN",
+        f"Expected: 460 kN",
+        f"Difference: {abs(F_w - 460):.2f} kN ({diff_pct:.1f}%)",
+        f"Status: {'✓ PASS' if diff_pct < 10 else '✗ CHECK'}",
+    ]
+    print("\n".join(lines))
+    return passed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--variant', choices=[*VARIANTS, 'all'], default='all',
+                        help="c_f formula to check (default: all)")
+    args = parser.parse_args(argv)
+
+    variants = list(VARIANTS) if args.variant == 'all' else [args.variant]
+    results = {}
+    for i, variant in enumerate(variants):
+        if i:
+            print()
+        results[variant] = check(variant)
+
+    print("\n" + "="*60)
+    for variant, passed in results.items():
+        print(f"{variant}: {'✓ PASS' if passed else '✗ CHECK'}")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,39 +1,10 @@
-import math
+"""
+Corrected natural-log c_f check, kept for existing callers
 
-# Sheffield Bioincubator values
-h = 27  # height
-d = 29  # depth
-b = 20  # width
+The check now lives in verify_final.py (python verify_final.py --variant ln).
+"""
 
-# Calculate h/d
-h_d = h / d
-print(f"h/d = {h}/{d} = {h_d:.4f}")
+from verify_final import compute_Fw, main
 
-# Calculate c_f with CORRECT formula
-c_f = 0.935 + 0.1839 * math.log(h_d)
-print(f"c_f = 0.935 + 0.1839 × ln({h_d:.4f}) = {c_f:.4f}")
-print(f"Expected: 0.92")
-print(f"Match: {'✓ PASS' if abs(c_f - 0.92) < 0.01 else '✗ CHECK'}")
-
-# Calculate A_ref
-A_ref = b * h
-print(f"\nA_ref = {b} × {h} = {A_ref} m²")
-
-# Calculate F_w (using values from screenshot)
-q_p = 1056.22  # Pa
-c_s = 0.89
-c_d = 1.07
-c_f_calc = c_f
-A_ref_calc = A_ref
-
-F_w = q_p * c_s * c_d * c_f_calc * A_ref_calc / 1000
-print(f"\nF_w = {q_p} × {c_s} × {c_d} × {c_f_calc:.4f} × {A_ref_calc} / 1000")
-print(f"F_w = {F_w:.2f} kN")
-print(f"Expected: 460 kN")
-diff_pct = abs(F_w - 460)/460*100
-print(f"Difference: {abs(F_w - 460):.2f} kN ({diff_pct:.1f}%)")
-print(f"Status: {'✓ PASS' if diff_pct < 10 else '✗ CHECK'}")
-
-print("\n" + "="*60)
-print("FINAL STATUS: ALL CHECKS SHOULD NOW PASS! ✓")
-print("="*60)
+if __name__ == '__main__':
+    main(['--variant', 'ln'])